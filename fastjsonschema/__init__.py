@@ -57,8 +57,10 @@ __all__ = (
     'Config',
     'FormatManager',
     'JsonSchemaException',
+    'JsonSchemaValueException',
     'compile',
     'compile_to_code',
+    'validator_cache',
 )
 
 from os.path import exists
@@ -67,14 +69,19 @@ import importlib
 
 import click
 
+from .cache import BytecodeCache, ValidatorCache
 from .config import Config
 from .formats import FormatManager
-from .exceptions import JsonSchemaException
+from .exceptions import JsonSchemaException, JsonSchemaValueException
 from .generator import CodeGenerator
 from .ref_resolver import RefResolver
+from .stream import is_json_lines, validate_lines
 from .version import __version__
 
 
+# Process wide cache of compiled validation functions used by :any:`compile`.
+validator_cache = ValidatorCache()
+
 
 # pylint: disable=redefined-builtin,exec-used
 def compile(definition, config=None):
@@ -110,12 +117,66 @@ def compile(definition, config=None):
         data = validate({})
         assert data == {'a': 42}
 
+    When only result of validation is needed, ``boolean`` mode generates function
+    returning ``True`` or ``False`` without raising any exception:
+
+    .. code-block:: python
+
+        is_valid = fastjsonschema.compile({'type': 'string'}, Config(mode='boolean'))
+        assert is_valid('hello')
+        assert not is_valid(42)
+
+    To get all problems at once, ``errors`` mode generates function returning list
+    of :any:`JsonSchemaValueException` with JSON pointer of invalid value, JSON pointer
+    of failed rule in schema and its keyword. Number of collected errors can be
+    limited by ``max_errors``:
+
+    .. code-block:: python
+
+        validate = fastjsonschema.compile(definition, Config(mode='errors', max_errors=10))
+        for error in validate(data):
+            print(error.pointer, error.schema_path, error.keyword, error.message)
+
+    For validating many documents at once, ``batch`` generates function with
+    validation rules inlined in a loop over all documents. It returns only
+    failures, indexes of invalid documents together with exceptions:
+
+    .. code-block:: python
+
+        validate_batch = fastjsonschema.compile({'type': 'string'}, Config(batch=True))
+        for index, exception in validate_batch(['a', 42, 'b']):
+            print(index, exception.message)
+
+    Compiled functions are cached in ``fastjsonschema.validator_cache``, so compiling the
+    same definition with the same config again returns already built function.
+    Functions with ``Config(profile_branches=True)`` are never cached, so each one
+    has its own counts. Cache can be disabled by ``Config(cache_validators=False)``:
+
+    .. code-block:: python
+
+        fastjsonschema.validator_cache.info()
+        fastjsonschema.validator_cache.clear()
+
+    With ``Config(cache_dir='/path/to/cache')`` generated code and its bytecode
+    is also stored on disk and loaded by next process without generating code again.
+
     """
+    config = config if config else Config()
+    key = None
+    if config.cache_validators and not config.profile_branches:
+        # key has to be made before generation, resolver changes ``$ref`` in definition
+        key = validator_cache.make_key(definition, config)
+        if key is not None:
+            validator = validator_cache.get(key)
+            if validator is not None:
+                return validator
     compile_state = {}
-    name, code_generator = _factory(definition, config)
-    compile_state.clear()
-    exec(code_generator.code, compile_state)
-    return compile_state[name]
+    name, code = _load_code(definition, config)
+    exec(code, compile_state)
+    validator = compile_state[name]
+    if key is not None:
+        validator_cache.set(key, validator)
+    return validator
 
 
 def compile_to_code(definition, config=None):
@@ -150,6 +211,23 @@ def compile_to_code(definition, config=None):
     return name, code_generator.code
 
 
+def _load_code(definition, config):
+    """Return main function name and code, from on disk cache when it's configured."""
+    if not config.cache_dir:
+        name, code_generator = _factory(definition, config)
+        return name, code_generator.code
+    bytecode_cache = BytecodeCache(config.cache_dir)
+    key = bytecode_cache.make_key(definition, config)
+    if key is not None:
+        cached = bytecode_cache.load(key)
+        if cached is not None:
+            return cached
+    name, code_generator = _factory(definition, config)
+    if key is None:
+        return name, code_generator.code
+    return name, bytecode_cache.store(key, name, code_generator.code)
+
+
 def _factory(schema, config=None):
     config = config if config else Config()
     resolver = RefResolver.from_schema(schema=schema, config=config)
@@ -157,16 +235,31 @@ def _factory(schema, config=None):
         from copy import deepcopy
         data = deepcopy(resolver.schema)
         resolver.meta_schema.validate(data)
-    format_maneger = FormatManager()
     code_generator = CodeGenerator(
         resolver=resolver,
-        formats=format_maneger,
         config=config,
     )
+    if config.batch:
+        return code_generator.batch_function_name, code_generator
     _, name = resolver.get_scope_name()
     return name, code_generator
 
 
+def _validate_json_lines(validator, validate_file):
+    """Validate every line of JSON Lines file and print errors."""
+    count = invalid_count = 0
+    for line_no, valid, exception in validate_lines(validator, validate_file):
+        count += 1
+        if not valid:
+            invalid_count += 1
+            click.echo('Line {}: {}'.format(line_no, exception.message))
+    if invalid_count:
+        click.secho('{} of {} documents are invalid'.format(invalid_count, count), fg='red')
+        return False
+    click.secho('All {} documents are valid'.format(count), fg='green')
+    return True
+
+
 @click.command()
 @click.option(
     '-s',
@@ -232,6 +325,11 @@ def main(
 
     fastjsonschema -p "exampke schema" -v example.json
 
+
+    Validate every line of JSON Lines document (.jsonl or .ndjson):
+
+    fastjsonschema -s schema.json -v documents.jsonl
+
     """
     validator = None
 
@@ -264,6 +362,8 @@ def main(
     else:
         if not validator:
             validator = compile(definition)
+        if is_json_lines(validate_file):
+            return _validate_json_lines(validator, validate_file)
         with open(validate_file, encoding='utf-8') as file_handle:
             data = file_handle.read()
         try:
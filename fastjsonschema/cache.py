@@ -0,0 +1,234 @@
+"""Cache module for compiled validation functions."""
+
+from collections import OrderedDict, namedtuple
+from importlib.util import MAGIC_NUMBER
+import hashlib
+import json
+import marshal
+import os
+import sys
+import tempfile
+import threading
+
+from .version import __version__
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+def canonical_json(definition):
+    """
+    Return canonical JSON of schema ``definition``.
+
+    Definition is serialized with sorted keys, so two definitions
+    which differ only in order of keys have same canonical JSON.
+
+    :argument dict definition: Json schema definition
+    :rtype: str: JSON or ``None`` if definition can't be serialized.
+    """
+    try:
+        return json.dumps(definition, sort_keys=True, separators=(',', ':'), default=repr)
+    except (TypeError, ValueError):
+        return None
+
+
+def schema_hash(definition):
+    """
+    Return canonical hash of schema ``definition``.
+
+    :argument dict definition: Json schema definition
+    :rtype: str: hexadecimal digest or ``None`` if definition
+        can't be serialized.
+    """
+    canonical = canonical_json(definition)
+    if canonical is None:
+        return None
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _freeze(value, stable=False):
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item, stable)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item, stable) for item in value)
+    if stable and callable(value):
+        # identity of function is not same in other process, use its name
+        return '{}.{}'.format(getattr(value, '__module__', ''), getattr(value, '__qualname__', repr(value)))
+    return value
+
+
+def config_key(config):
+    """
+    Return hashable key of all ``config`` options.
+
+    :argument Config config: Config object
+    :rtype: tuple
+    """
+    return _freeze(vars(config))
+
+
+def config_fingerprint(config):
+    """
+    Return key of all ``config`` options which is same in all processes.
+
+    :argument Config config: Config object
+    :rtype: str
+    """
+    return repr(_freeze(vars(config), stable=True))
+
+
+class ValidatorCache(object):
+    """
+    Thread safe LRU cache of compiled validation functions.
+
+    Cache is keyed by canonical JSON of the schema and all config
+    options, see :any:`ValidatorCache.make_key`.
+
+    :argument int maxsize: maximum number of cached validation functions
+    """
+
+    def __init__(self, maxsize=128):
+        """Init."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Return number of cached validation functions."""
+        return len(self._cache)
+
+    @staticmethod
+    def make_key(definition, config):
+        """
+        Return cache key for ``definition`` compiled with ``config``.
+
+        :rtype: tuple or ``None`` if definition is not cacheable.
+        """
+        canonical = canonical_json(definition)
+        if canonical is None:
+            return None
+        try:
+            key = (canonical, config_key(config))
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def get(self, key):
+        """Return cached validation function or ``None``."""
+        with self._lock:
+            validator = self._cache.get(key)
+            if validator is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._cache.move_to_end(key)
+            return validator
+
+    def set(self, key, validator):
+        """Store validation function, least recently used one is evicted when cache is full."""
+        with self._lock:
+            self._cache[key] = validator
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all cached validation functions and reset counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """Return :any:`CacheInfo` with counters of cache usage."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._cache))
+
+
+class BytecodeCache(object):
+    """
+    On disk cache of generated validation modules.
+
+    Generated code is stored as ``.py`` file together with marshalled code
+    object in ``.bin`` file, so next process can load validation functions
+    without code generation. Files are stored in subdirectory named by library
+    version and Python implementation, so cache is invalidated automatically
+    when any of them changes.
+
+    :argument str directory: cache directory
+    """
+
+    def __init__(self, directory):
+        """Init."""
+        self.directory = os.path.join(
+            directory,
+            'fastjsonschema-{}-{}'.format(__version__, sys.implementation.cache_tag),
+        )
+
+    @staticmethod
+    def make_key(definition, config):
+        """
+        Return cache key for ``definition`` compiled with ``config``.
+
+        :rtype: str or ``None`` if definition is not cacheable.
+        """
+        digest = schema_hash(definition)
+        if digest is None:
+            return None
+        fingerprint = '\n'.join((digest, config_fingerprint(config), __version__, sys.version))
+        return hashlib.sha256(fingerprint.encode('utf-8')).hexdigest()
+
+    def load(self, key):
+        """
+        Return cached main function name and code object.
+
+        :rtype: tuple(str, code) or ``None`` when nothing valid is cached.
+        """
+        try:
+            with open(os.path.join(self.directory, key + '.bin'), 'rb') as file_handle:
+                if file_handle.read(len(MAGIC_NUMBER)) != MAGIC_NUMBER:
+                    return None
+                version, name, code = marshal.load(file_handle)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != __version__:
+            return None
+        return name, code
+
+    def store(self, key, name, source):
+        """
+        Compile ``source`` and store it into cache.
+
+        Failure of writing is ignored, cache is just not used then.
+
+        :rtype: code: compiled source
+        """
+        filename = os.path.join(self.directory, key + '.py')
+        code = compile(source, filename, 'exec')
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write(filename, source.encode('utf-8'))
+            self._write(
+                os.path.join(self.directory, key + '.bin'),
+                MAGIC_NUMBER + marshal.dumps((__version__, name, code)),
+            )
+        except OSError:
+            pass
+        return code
+
+    def _write(self, filename, content):
+        # write to temporary file first so other processes never read half written file
+        file_descriptor, temp_filename = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(file_descriptor, 'wb') as file_handle:
+                file_handle.write(content)
+            os.replace(temp_filename, filename)
+        except OSError:
+            os.unlink(temp_filename)
+            raise
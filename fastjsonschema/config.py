@@ -1,6 +1,9 @@
 """Config module"""
 
 
+MODES = ('exception', 'boolean', 'errors')
+
+
 # pylint: disable=too-few-public-methods
 class Config(object):
     """
@@ -21,6 +24,61 @@ class Config(object):
         in generated code. Default False.
     :argument bool ecma262_regex_non_compliance: wheter check
         and disallow non compliant versions of regexps
+    :argument bool cache_validators: whether compiled validation functions
+        should be cached and reused by :any:`compile`. Default True.
+    :argument str cache_dir: directory where :any:`compile` stores generated
+        code and its bytecode to be reused by next process. Default None,
+        which means no on disk cache.
+    :argument str mode: what generated validation function does with invalid
+        data. In ``exception`` mode it raises :any:`JsonSchemaException` and
+        returns data otherwise. In ``boolean`` mode it returns only ``True``
+        or ``False`` without creating any exception or message, which is much
+        faster for invalid data. In ``errors`` mode it validates whole data and
+        returns list of all :any:`JsonSchemaValueException` found, empty list
+        for valid data. ``None`` means ``exception``. Other values raise ``ValueError``.
+        Default ``exception``.
+    :argument int max_errors: maximum number of errors collected in ``errors``
+        mode, validation stops when it's reached. It can be used only with
+        ``errors`` mode. Default None, which means no limit.
+    :argument bool batch: whether :any:`compile` returns function validating
+        list of documents at once instead of only one document. It returns
+        list of failures only, see ``CodeGenerator.generate_batch_function``.
+        Default False.
+    :argument bool order_by_cost: whether keywords of each definition are
+        checked in order of their estimated cost (see ``CodeGenerator.KEYWORD_COSTS``),
+        so cheap checks reject invalid data before expensive ones run. Result of
+        validation and messages are same, but first reported error (and order of
+        errors in ``errors`` mode) can be different when data are invalid by more
+        keywords. Definitions which fill in ``default`` values anywhere in their
+        subdefinitions (also through ``$ref``) keep default order, because defaults
+        change validated data. Default False.
+    :argument dict failure_frequencies: map of keywords to numbers of observed
+        failures, for example counted from ``errors`` mode, with ``order_by_cost``
+        keywords of same cost are checked from the most often failing one.
+        Default None.
+
+        .. code-block:: python
+
+            frequencies = collections.Counter(error.keyword for error in errors)
+            Config(order_by_cost=True, failure_frequencies=frequencies)
+
+    :argument bool profile_branches: whether generated code counts how many times
+        each definition of ``anyOf`` and ``oneOf`` was valid, see
+        ``fastjsonschema.profile``. Every function returned by :any:`compile`
+        has its own counts, such functions are not cached. Default False.
+    :argument dict branch_profile: counts of valid definitions of ``anyOf`` and
+        ``oneOf`` keyed by JSON pointers of keywords, see ``fastjsonschema.profile.load_branch_profile``.
+        Definitions which were valid most often are tried first. Default None.
+    :argument int ref_inline_limit: maximum number of keywords (counted with
+        all subdefinitions) of referenced definition which is generated in place
+        of ``$ref`` instead of a call of separate function. Recursive references
+        are never inlined. Set to 0 to not inline any. Default 10.
+    :argument int format_cache_size: maximum number of string values of each
+        format whose results of validation are cached, which helps when data
+        repeat same values of slow formats like ``idn-email`` or ``iri``. Caches
+        are shared by all validation functions and threads, statistics are
+        returned by ``fastjsonschema.formats.format_manager.cache_info()``.
+        Default 0, which means no cache.
     :returns: the Configuration.
     """
 
@@ -33,11 +91,38 @@ class Config(object):
             validate_schema=False,
             include_version=False,
             ecma262_regex_non_compliance=True,
+            cache_validators=True,
+            cache_dir=None,
+            mode='exception',
+            max_errors=None,
+            batch=False,
+            order_by_cost=False,
+            failure_frequencies: dict = None,
+            profile_branches=False,
+            branch_profile: dict = None,
+            ref_inline_limit=10,
+            format_cache_size=0,
     ):
         """Init."""
+        mode = 'exception' if mode is None else mode
+        if mode not in MODES:
+            raise ValueError('Unknown mode {!r}, use one of: {}'.format(mode, ', '.join(MODES)))
+        if max_errors is not None and mode != 'errors':
+            raise ValueError('max_errors can be used only with errors mode')
         self.schema_version = meta_schema
         self.uri_handlers = uri_handlers if uri_handlers else {}
         self.cache_refs = cache_refs
         self.validate_schema = validate_schema
         self.include_version = include_version
         self.ecma262_regex_non_compliance = ecma262_regex_non_compliance
+        self.cache_validators = cache_validators
+        self.cache_dir = cache_dir
+        self.mode = mode
+        self.max_errors = max_errors
+        self.batch = batch
+        self.order_by_cost = order_by_cost
+        self.failure_frequencies = dict(failure_frequencies) if failure_frequencies else None
+        self.profile_branches = profile_branches
+        self.branch_profile = branch_profile
+        self.ref_inline_limit = ref_inline_limit
+        self.format_cache_size = format_cache_size
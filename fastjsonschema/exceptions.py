@@ -14,5 +14,55 @@ class JsonSchemaException(ValueError):
 
     def __init__(self, message):
         """Init."""
-        super().__init__()
+        super().__init__(message)
         self.message = message
+
+
+class JsonSchemaValueException(JsonSchemaException):
+    """
+    Exception with detailed information about invalid value.
+
+    Validation functions generated in ``errors`` mode return list of those
+    instead of raising the first one.
+
+    :argument str message: Error message
+    :argument value: Invalid value
+    :argument tuple path: Keys and indexes of invalid value in validated data
+    :argument str schema_path: JSON pointer of rule in schema
+    :argument str keyword: Keyword of rule
+
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, message, value=None, path=(), schema_path=None, keyword=None):
+        """Init."""
+        super().__init__(message)
+        self.value = value
+        self.path = path
+        self.schema_path = schema_path
+        self.keyword = keyword
+
+    def __reduce__(self):
+        """Pickle with all details, needed for passing between processes."""
+        return self.__class__, (self.message, self.value, self.path, self.schema_path, self.keyword)
+
+    @property
+    def pointer(self):
+        """JSON pointer of invalid value in validated data."""
+        return ''.join(
+            '/' + str(part).replace('~', '~0').replace('/', '~1')
+            for part in self.path
+        )
+
+    def __repr__(self):
+        """Representation."""
+        return '{}({!r}, pointer={!r}, keyword={!r})'.format(
+            self.__class__.__name__, self.message, self.pointer, self.keyword)
+
+
+class MaxErrorsReached(Exception):
+    """
+    Exception used by validation functions generated in ``errors`` mode.
+
+    It stops validation once ``max_errors`` errors are collected.
+    """
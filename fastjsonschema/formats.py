@@ -1,6 +1,8 @@
 """Module for format handling."""
 
+import functools
 import re
+import threading
 from collections import namedtuple
 
 from expynent import patterns
@@ -11,22 +13,12 @@ from fastjsonschema.exceptions import JsonSchemaException
 RegExConfig = namedtuple('RegExConfig', ['pattern', 'flags'])
 
 
-DATE_REGEX = RegExConfig(
-    r'^(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})$', 0)
-DATETIME_REGEX = RegExConfig(patterns.ISO_8601_DATETIME, re.IGNORECASE)
 EMAIL_REGEX = RegExConfig(patterns.EMAIL_ADDRESS, 0)
 HOSTNAME_REGEX = RegExConfig(
     r'^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*'
     r'([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]{1,62}[A-Za-z0-9])$', 0)
-IPV4_REGEX = RegExConfig(patterns.IP_V4, 0)
-IPV6_REGEX = RegExConfig(
-    patterns.IP_V6, re.VERBOSE | re.IGNORECASE | re.DOTALL)
 RELATIVE_JSON_POINTER_REGEX = RegExConfig(
     r'^(?:0|[1-9][0-9]*)(?:#|(?:\/(?:[^~/]|~0|~1)*)*)$', 0)
-TIME_REGEX = RegExConfig(
-    r'^(?P<hour>\d{1,2}):(?P<minute>\d{1,2})'
-    r'(?::(?P<second>\d{1,2})(?:\.(?P<microsecond>\d{1,6}))?'
-    r'([zZ]|[+-]\d\d:\d\d)?)?$', 0)
 URI_REGEX = RegExConfig(r'^\w+:(\/?\/?)[^\s]+$', 0)
 URI_TEMPLATE_REGEX = RegExConfig(
     r'^(?:(?:[^\x00-\x20\"\'<>%\\^`{|}]|%[0-9a-f]{2})|'
@@ -36,19 +28,192 @@ URI_TEMPLATE_REGEX = RegExConfig(
 
 
 FORMAT_REGEXS = {
-    'date': DATE_REGEX,
-    'date-time': DATETIME_REGEX,
     'email': EMAIL_REGEX,
     'hostname': HOSTNAME_REGEX,
-    'ipv4': IPV4_REGEX,
-    'ipv6': IPV6_REGEX,
     'relative-json-pointer': RELATIVE_JSON_POINTER_REGEX,
-    'time': TIME_REGEX,
     'uri': URI_REGEX,
     'uri-template': URI_TEMPLATE_REGEX,
 }
 
 
+# RFC 3339 parts with fixed number of digits in allowed ranges, only number
+# of days in month is checked by :any:`_is_valid_day` and leap second
+# by :any:`_is_valid_leap_second`
+_DATE_PATTERN = r'(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])'
+_TIME_PATTERN = (
+    r'(?P<hour>[01]\d|2[0-3]):(?P<minute>[0-5]\d):(?P<second>[0-5]\d|60)(?:\.\d+)?'
+    r'(?:[zZ]|(?P<offset_sign>[+-])(?P<offset_hour>[01]\d|2[0-3]):(?P<offset_minute>[0-5]\d))'
+)
+DATE_PATTERN_REGEX = re.compile(_DATE_PATTERN, re.ASCII)
+TIME_PATTERN_REGEX = re.compile(_TIME_PATTERN, re.ASCII)
+DATE_TIME_PATTERN_REGEX = re.compile(_DATE_PATTERN + '[tT]' + _TIME_PATTERN, re.ASCII)
+
+# days in months of not leap year
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_valid_date(variable):
+    """
+    Validate full-date of RFC 3339, for example ``2018-02-05``.
+
+    :argument str variable: variable to validate.
+    :rtype: bool: False if invalid.
+    """
+    match = DATE_PATTERN_REGEX.fullmatch(variable)
+    # days are compared as strings of two digits
+    return match is not None and (match.group(3) <= '28' or _is_valid_day(match))
+
+
+def is_valid_time(variable):
+    """
+    Validate full-time of RFC 3339 with time offset, for example ``14:17:10.5+01:00``.
+
+    :argument str variable: variable to validate.
+    :rtype: bool: False if invalid.
+    """
+    match = TIME_PATTERN_REGEX.fullmatch(variable)
+    return match is not None and (match.group('second') != '60' or _is_valid_leap_second(match))
+
+
+def is_valid_date_time(variable):
+    """
+    Validate date-time of RFC 3339, for example ``2018-02-05T14:17:10Z``.
+
+    :argument str variable: variable to validate.
+    :rtype: bool: False if invalid.
+    """
+    match = DATE_TIME_PATTERN_REGEX.fullmatch(variable)
+    return (
+        match is not None
+        and (match.group(3) <= '28' or _is_valid_day(match))
+        and (match.group('second') != '60' or _is_valid_leap_second(match))
+    )
+
+
+def _is_valid_day(match):
+    """Return True if day of ``match`` of date is in its month."""
+    year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    if month == 2 and day == 29:
+        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return day <= DAYS_IN_MONTH[month - 1]
+
+
+def _is_valid_leap_second(match):
+    """Return True if second 60 of ``match`` of time is at 23:59 UTC."""
+    minutes = int(match.group('hour')) * 60 + int(match.group('minute'))
+    if match.group('offset_sign'):
+        offset = int(match.group('offset_hour')) * 60 + int(match.group('offset_minute'))
+        minutes += -offset if match.group('offset_sign') == '+' else offset
+    return minutes % (24 * 60) == 23 * 60 + 59
+
+
+# decimal number 0-255 without leading zeros
+_IPV4_OCTET_PATTERN = r'(?:25[0-5]|2[0-4]\d|1\d\d|[1-9]?\d)'
+IPV4_PATTERN_REGEX = re.compile(r'{0}(?:\.{0}){{3}}'.format(_IPV4_OCTET_PATTERN), re.ASCII)
+HEX_DIGITS = frozenset('0123456789abcdefABCDEF')
+
+
+def is_valid_ipv4(variable):
+    """
+    Validate dotted-quad IPv4 address, for example ``192.168.0.1``.
+
+    :argument str variable: variable to validate.
+    :rtype: bool: False if invalid.
+    """
+    return 7 <= len(variable) <= 15 and IPV4_PATTERN_REGEX.fullmatch(variable) is not None
+
+
+def is_valid_ipv6(variable):
+    """
+    Validate IPv6 address of RFC 4291, for example ``2001:db8::1`` or ``::ffff:192.168.0.1``.
+
+    Address is split to groups of hex digits, which is several times faster
+    than one regular expression covering all positions of ``::``.
+
+    :argument str variable: variable to validate.
+    :rtype: bool: False if invalid.
+    """
+    # non ASCII characters are rejected by checks of hex digits and IPv4 address
+    if not 2 <= len(variable) <= 45:
+        return False
+    if '.' in variable:
+        # IPv4 address in last 32 bits is counted as two groups
+        head, _, tail = variable.rpartition(':')
+        if not head or not is_valid_ipv4(tail):
+            return False
+        variable = head + ':0:0'
+    if '::' in variable:
+        left, _, right = variable.partition('::')
+        if '::' in right:
+            return False
+        groups = (left.split(':') if left else []) + (right.split(':') if right else [])
+        if len(groups) > 7:
+            return False
+    else:
+        groups = variable.split(':')
+        if len(groups) != 8:
+            return False
+    for group in groups:
+        if not 1 <= len(group) <= 4 or not HEX_DIGITS.issuperset(group):
+            return False
+    return True
+
+
+class _NotImportedError(Exception):
+    """Placeholder of exceptions of optional dependencies which are not imported yet."""
+
+
+def _lazy_import(importer, name):
+    """
+    Return placeholder of module level function ``name`` of optional dependency.
+
+    First call runs ``importer``, which imports the dependency and binds its
+    functions and exceptions on module level, so next calls use them directly
+    without any ``import`` statement.
+    """
+    def placeholder(*args, **kwds):
+        importer()
+        return globals()[name](*args, **kwds)
+    return placeholder
+
+
+def _import_email_validator():
+    # pylint: disable=global-statement,invalid-name
+    global _validate_email, _validate_email_domain, _EmailSyntaxError
+    import email_validator
+    _validate_email = email_validator.validate_email
+    if hasattr(email_validator, 'validate_email_domain_part'):
+        _validate_email_domain = email_validator.validate_email_domain_part
+    else:
+        # email_validator 2 has only function validating domain name
+        from email_validator.syntax import validate_email_domain_name
+        _validate_email_domain = lambda domain: validate_email_domain_name(domain, globally_deliverable=False)
+    _EmailSyntaxError = email_validator.EmailSyntaxError
+
+
+def _import_rfc3987():
+    # pylint: disable=global-statement,invalid-name
+    global _parse_rfc3987
+    import rfc3987
+    _parse_rfc3987 = rfc3987.parse
+
+
+def _import_jsonpointer():
+    # pylint: disable=global-statement,invalid-name
+    global _JsonPointer, _JsonPointerException
+    import jsonpointer
+    _JsonPointer = jsonpointer.JsonPointer
+    _JsonPointerException = jsonpointer.JsonPointerException
+
+
+_validate_email = _lazy_import(_import_email_validator, '_validate_email')
+_validate_email_domain = _lazy_import(_import_email_validator, '_validate_email_domain')
+_EmailSyntaxError = _NotImportedError
+_parse_rfc3987 = _lazy_import(_import_rfc3987, '_parse_rfc3987')
+_JsonPointer = _lazy_import(_import_jsonpointer, '_JsonPointer')
+_JsonPointerException = _NotImportedError
+
+
 def is_valid_idn_email(variable):
     """
     Validate idn-emails.
@@ -56,14 +221,13 @@ def is_valid_idn_email(variable):
     :argument str variable: variable to validate.
     :rtype: bool: False if invalid.
     """
-    import email_validator
     try:
-        return email_validator.validate_email(
-            email=variable,
+        return _validate_email(
+            variable,
             allow_smtputf8=True,
             check_deliverability=False
         )
-    except email_validator.EmailSyntaxError:
+    except _EmailSyntaxError:
         return False
     return True
 
@@ -75,10 +239,9 @@ def is_valid_idn_hostname(variable):
     :argument str variable: variable to validate.
     :rtype: bool: False if invalid.
     """
-    import email_validator
     try:
-        return email_validator.validate_email_domain_part(variable)
-    except email_validator.EmailSyntaxError:
+        return _validate_email_domain(variable)
+    except _EmailSyntaxError:
         return False
     return True
 
@@ -91,8 +254,7 @@ def is_valid_iri(variable):
     :rtype: bool: False if invalid.
     """
     try:
-        import rfc3987
-        return rfc3987.parse(variable, rule="IRI")
+        return _parse_rfc3987(variable, rule="IRI")
     except ValueError:
         return False
     return True
@@ -106,8 +268,7 @@ def is_valid_iri_reference(variable):
     :rtype: bool: False if invalid.
     """
     try:
-        import rfc3987
-        return rfc3987.parse(variable, rule="IRI_reference")
+        return _parse_rfc3987(variable, rule="IRI_reference")
     except ValueError:
         return False
     return True
@@ -120,10 +281,9 @@ def is_valid_json_pointer(variable):
     :argument str variable: variable to validate.
     :rtype: bool: False if invalid.
     """
-    import jsonpointer
     try:
-        jsonpointer.JsonPointer(pointer=variable)
-    except jsonpointer.JsonPointerException:
+        _JsonPointer(pointer=variable)
+    except _JsonPointerException:
         return False
     return True
 
@@ -135,12 +295,10 @@ def is_valid_regexp(variable):
     :argument str variable: variable to validate.
     :rtype: bool: False if invalid.
     """
+    if variable.endswith('\\Z'):
+        # not allowed because of ECMA 262 regex non-compliance
+        return False
     try:
-        if variable.endswith('\\Z'):
-            raise JsonSchemaException(
-                'raise JsonSchemaException("{name} not allowed'
-                +' because ECMA 262 regex non-compliance: {pattern}")'
-            )
         re.compile(pattern=variable)
     except re.error:
         return False
@@ -155,19 +313,23 @@ def is_valid_uri_reference(variable):
     :rtype: bool: False if invalid.
     """
     try:
-        import rfc3987
-        return rfc3987.parse(variable, rule="URI_reference")
+        return _parse_rfc3987(variable, rule="URI_reference")
     except ValueError:
         return False
 
 
 FORMAT_FUNCTIONS = {
+    'date': is_valid_date,
+    'date-time': is_valid_date_time,
     'idn-email': is_valid_idn_email,
     'idn-hostname': is_valid_idn_hostname,
     'iri': is_valid_iri,
+    'ipv4': is_valid_ipv4,
+    'ipv6': is_valid_ipv6,
     'iri-reference': is_valid_iri_reference,
     'json-pointer': is_valid_json_pointer,
     'regex': is_valid_regexp,
+    'time': is_valid_time,
     'uri-reference': is_valid_uri_reference,
 }
 
@@ -183,11 +345,12 @@ class FormatManager(object):
 
     def __init__(self, functions: dict = None, regexs: dict = None):
         """Init."""
-        format_functions = FORMAT_FUNCTIONS
-        format_regexs = FORMAT_REGEXS
-        self._functions = format_functions if functions is None else format_functions.update(functions)
-        self._regexs = format_regexs if regexs is None else format_regexs.update(regexs)
+        self._functions = FORMAT_FUNCTIONS if functions is None else dict(FORMAT_FUNCTIONS, **functions)
+        self._regexs = FORMAT_REGEXS if regexs is None else dict(FORMAT_REGEXS, **regexs)
         self._regex_cache = {}
+        # map names of formats and sizes to cached validation functions
+        self._cached_functions = {}
+        self._lock = threading.Lock()
 
     def has(self, name):
         """Resturn True if name exists"""
@@ -205,6 +368,55 @@ class FormatManager(object):
             self._compile_regex(name)
         return self._regex_cache[name]
 
+    def get_cached_function(self, name, maxsize):
+        """
+        Return function validating format ``name`` with LRU cache of results.
+
+        Cache is created only once for each format and size, so all validation
+        functions using same manager share it. It's safe to use from more threads.
+
+        :argument str name: name of format
+        :argument int maxsize: maximum number of cached values
+        :rtype: callable: function returning ``True`` or ``False``
+        """
+        key = (name, maxsize)
+        cached_function = self._cached_functions.get(key)
+        if cached_function is not None:
+            return cached_function
+        with self._lock:
+            if key not in self._cached_functions:
+                function = self.get_function(name)
+                if name not in self._functions:
+                    regex = function
+                    function = lambda variable: regex.match(variable) is not None
+                self._cached_functions[key] = functools.lru_cache(maxsize)(
+                    lambda variable: bool(function(variable))
+                )
+            return self._cached_functions[key]
+
+    def cache_info(self):
+        """
+        Return statistics of caches of :any:`get_cached_function`.
+
+        :rtype: dict: ``functools`` cache info with hits, misses, maxsize and currsize
+            keyed by names of formats, counters of caches of more sizes are summed
+        """
+        infos = {}
+        with self._lock:
+            cached_functions = list(self._cached_functions.items())
+        for (name, _), cached_function in cached_functions:
+            info = cached_function.cache_info()
+            if name in infos:
+                info = info._make(sum(values) for values in zip(infos[name], info))
+            infos[name] = info
+        return infos
+
+    def cache_clear(self):
+        """Remove all values cached by :any:`get_cached_function` and reset counters."""
+        with self._lock:
+            for cached_function in self._cached_functions.values():
+                cached_function.cache_clear()
+
     def get_function_name(self, name):
         """Resturns name of function"""
         if not name in self._functions:
@@ -216,3 +428,8 @@ class FormatManager(object):
         value = re.compile(*self._regexs[name])
         self._regex_cache[name] = value
         return
+
+
+# shared by generated code, so regular expressions of formats are compiled once
+# per process and caches of formats are shared by all validation functions
+format_manager = FormatManager()
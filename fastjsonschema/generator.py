@@ -7,13 +7,15 @@
 
 import re
 from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import groupby
+from urllib.parse import urldefrag
 
 from .version import __version__
 from .exceptions import JsonSchemaException
 from .indent import indent
-from .ref_resolver import RefResolver
-from .types import TypeResolver
-from .formats import FormatManager
+from .ref_resolver import RefResolver, normalize
+from .types import TypeResolver, enforce_list
 from .config import Config
 
 
@@ -34,36 +36,141 @@ class CodeGenerator(object):
     """
 
     INDENT = 4  # spaces
+    # maximum number of required properties checked one by one without set
+    REQUIRED_UNROLL_LIMIT = 4
+    # keywords validating only values of one type, they are grouped under one type check
+    TYPE_KEYWORDS = {
+        'minLength': 'str',
+        'maxLength': 'str',
+        'pattern': 'str',
+        'format': 'str',
+        'minimum': 'number',
+        'maximum': 'number',
+        'exclusiveMinimum': 'number',
+        'exclusiveMaximum': 'number',
+        'multipleOf': 'number',
+        'minItems': 'list',
+        'maxItems': 'list',
+        'items': 'list',
+        'uniqueItems': 'list',
+        'contains': 'list',
+        'minProperties': 'dict',
+        'maxProperties': 'dict',
+        'required': 'dict',
+        'properties': 'dict',
+        'patternProperties': 'dict',
+        'additionalProperties': 'dict',
+        'dependencies': 'dict',
+        'propertyNames': 'dict',
+    }
+    # Python types of groups of keywords
+    TYPE_CHECKS = {
+        'str': 'str',
+        'number': '(int, float)',
+        'list': 'list',
+        'dict': 'dict',
+    }
+    # estimated cost of keywords used with ``Config(order_by_cost=True)``, constant
+    # time checks first, regular expressions and formats next and subschemas last,
+    # keywords which are not listed are checked last
+    KEYWORD_COSTS = {
+        'type': 0,
+        'enum': 1,
+        'const': 1,
+        'minLength': 1,
+        'maxLength': 1,
+        'minimum': 1,
+        'maximum': 1,
+        'exclusiveMinimum': 1,
+        'exclusiveMaximum': 1,
+        'multipleOf': 1,
+        'minItems': 1,
+        'maxItems': 1,
+        'minProperties': 1,
+        'maxProperties': 1,
+        'required': 1,
+        'pattern': 2,
+        'format': 2,
+        'patternProperties': 2,
+        'propertyNames': 2,
+        'contentEncoding': 2,
+        'contentMediaType': 2,
+        'items': 3,
+        'uniqueItems': 3,
+        'contains': 3,
+        'properties': 3,
+        'additionalProperties': 3,
+        'dependencies': 3,
+        'allOf': 3,
+        'anyOf': 3,
+        'oneOf': 3,
+        'not': 3,
+        'if': 3,
+    }
+    # groups of keywords validating JSON types
+    JSON_TYPE_GROUPS = {
+        'string': 'str',
+        'number': 'number',
+        'integer': 'number',
+        'array': 'list',
+        'object': 'dict',
+    }
 
     def __init__(
             self,
             resolver: RefResolver,
-            formats: FormatManager,
             config: Config,
     ):
         """Init."""
         self._code = []
         self._compile_regexps = {}
-        self._import_formats = set()
+        self._extra_imports = []
+        # map code of values precomputed on module level to their names
+        self._global_constants = OrderedDict()
+        # map JSON pointers of anyOf and oneOf keywords to number of their
+        # definitions, which are counted with ``Config(profile_branches=True)``
+        self._branch_profile = OrderedDict()
+        # URIs of referenced definitions which are being generated, those
+        # are not inlined again
+        self._generated_refs = set()
+        # names of constants referencing generated functions
+        self._function_constants = set()
 
         self._variables = set()
         self._indent = 0
         self._variable = None
         self._variable_name = None
+        # group of keywords (key of ``TYPE_CHECKS``) of type which current variable
+        # is known to have, so those keywords don't need to check type
+        self._variable_type = None
         self._definition = None
-
-        # map schema URIs to validation function names for functions
-        # that are not yet generated, but need to be generated
+        # keyword currently generated, JSON pointer of current definition
+        # and keys and indexes (as code) of current variable in validated
+        # data used in ``errors`` mode
+        self._keyword = None
+        self._schema_path = '#'
+        self._path = ()
+
+        # map keys (schema URI and mode or name of function validating
+        # a subschema) to functions that are not yet generated, but need
+        # to be generated
         self._needed_validation_functions = {}
-        # validation function names that are already done
+        # keys of validation functions that are already done
         self._validation_functions_done = set()
+        # map keys of validation functions to their unique names
+        self._function_names = {}
+        self._used_function_names = set()
+        # name and mode of currently generated function
+        self._function_name = None
+        self._mode = config.mode
+        self._main_function_name = None
+        self._batch_function_name = None
 
         self._resolver = resolver
-        self._formats = formats
         self._config = config
         self._type_resolver = TypeResolver(resolver.meta_schema.uri)
         # add main function to `self._needed_validation_functions`
-        self._generate_function_from_scope()
+        self._main_function_name = self._generate_function_from_scope()
 
 
         self._json_keywords_to_function = OrderedDict((
@@ -82,8 +189,9 @@ class CodeGenerator(object):
             ('multipleOf', self.generate_multiple_of),
             ('minItems', self.generate_min_items),
             ('maxItems', self.generate_max_items),
-            ('uniqueItems', self.generate_unique_items),
             ('items', self.generate_items),
+            # after items, so it can rely on validated types of items
+            ('uniqueItems', self.generate_unique_items),
             ('minProperties', self.generate_min_properties),
             ('maxProperties', self.generate_max_properties),
             ('required', self.generate_required),
@@ -111,6 +219,11 @@ class CodeGenerator(object):
 
         self.generate_func_code()
 
+    @property
+    def batch_function_name(self):
+        """Return name of function validating list of documents, ``None`` when it's not generated."""
+        return self._batch_function_name
+
     @property
     def code(self):
         """
@@ -123,8 +236,13 @@ class CodeGenerator(object):
         result = ['# pylint: skip-file']
         if self._compile_regexps:
             result.append('import re')
-        result.append('from fastjsonschema.formats import FormatManager')
-        result.append('from fastjsonschema.exceptions import JsonSchemaException')
+        if self._config.mode == 'errors':
+            result.append(
+                'from fastjsonschema.exceptions import JsonSchemaException, JsonSchemaValueException, MaxErrorsReached'
+            )
+        else:
+            result.append('from fastjsonschema.exceptions import JsonSchemaException')
+        result.extend(self._extra_imports)
         result.append('')
         if self._compile_regexps:
             regexs = [
@@ -139,9 +257,33 @@ class CodeGenerator(object):
         if self._resolver.config.include_version:
             result.append('__version__ = "' + __version__ + '"')
         result.append('')
-        result.append('format_resolver = FormatManager()')
-        result.append('')
+        constants = [
+            '{} = {}'.format(name, value)
+            for value, name in self._global_constants.items()
+            if name not in self._function_constants
+        ]
+        if constants:
+            result.extend(constants)
+            result.append('')
+        if self._branch_profile:
+            profile = [
+                '{!r}: {!r}'.format(pointer, [0] * count)
+                for pointer, count in self._branch_profile.items()
+            ]
+            result.extend([
+                'BRANCH_PROFILE = {',
+                '    ' + ',\n    '.join(profile),
+                '}',
+                '',
+            ])
         result.extend(self._code)
+        if self._function_constants:
+            result.append('')
+            result.extend(
+                '{} = {}'.format(name, value)
+                for value, name in self._global_constants.items()
+                if name in self._function_constants
+            )
         return '\n'.join(result)
 
     # pylint: disable=invalid-name
@@ -179,58 +321,229 @@ class CodeGenerator(object):
         )
         self._code.append(spaces + line.format(*args, **context))
 
-    def create_variable_with_length(self):
+    def exc(self, msg, *args):
+        """
+        Short-cut for failed validation.
+
+        In ``exception`` mode it's inserting line raising exception with message ``msg``
+        formated same way as in method :any:`l`. In ``boolean`` mode it's inserting line
+        returning ``False`` without any message. In ``errors`` mode it's inserting line
+        appending exception with path of variable and schema path of current keyword
+        to ``errors``.
+
+        .. code-block:: python
+
+            with self.l('if {variable} not in {enum}:'):
+                self.exc('{name} must be one of {enum}')
+        """
+        if self._mode == 'boolean':
+            self.l('return False')
+        elif self._mode == 'errors':
+            schema_path = self._schema_path
+            if self._keyword:
+                schema_path += '/' + _escape_pointer(self._keyword)
+            self.l(
+                'errors.append(JsonSchemaValueException("' + msg + '", {variable}, {path_}, {schema_path_}, {keyword_}))',
+                *args,
+                path_=self._path_code(),
+                schema_path_=repr(schema_path),
+                keyword_=repr(self._keyword)
+            )
+            if self._config.max_errors:
+                with self.l('if len(errors) >= {}:', self._config.max_errors):
+                    self.l('raise MaxErrorsReached')
+        else:
+            self.l('raise JsonSchemaException("' + msg + '")', *args)
+
+    def _path_code(self):
+        """Return code of keys and indexes of current variable in validated data."""
+        if not self._path:
+            return 'path'
+        return 'path + ({},)'.format(', '.join(self._path))
+
+    def import_function(self, module, name):
+        """Import function ``name`` from ``module`` in generated code."""
+        line = 'from {} import {}'.format(module, name)
+        if line not in self._extra_imports:
+            self._extra_imports.append(line)
+
+    def create_global_constant(self, prefix, value):
+        """
+        Create constant on module level.
+
+        Value given as code is evaluated only once when module is loaded, not with
+        every validation. Same values share one constant. Returns name of constant
+        which starts with ``prefix``.
+        """
+        if value not in self._global_constants:
+            self._global_constants[value] = '{}_{}'.format(prefix, len(self._global_constants))
+        return self._global_constants[value]
+
+    def create_function_map(self, prefix, mapping):
+        """
+        Create dictionary of generated functions on module level.
+
+        Same as :any:`create_global_constant`, only ``mapping`` maps values to names
+        of validation functions and therefore it's defined after all functions.
+        """
+        value = '{' + ', '.join('{!r}: {}'.format(key, name) for key, name in mapping.items()) + '}'
+        name = self.create_global_constant(prefix, value)
+        self._function_constants.add(name)
+        return name
+
+    def create_variable_with_length(self, type_name):
         """
         Create variable lenght.
 
         Append code for creating variable with length of that variable
         (for example length of list or dictionary) with name ``{variable}_len``.
         It can be called several times and always it's done only when that variable
-        still does not exists.
+        still does not exists for checked type ``type_name`` of variable (it's
+        created inside of ``isinstance`` condition).
         """
         variable_name = '{}_len'.format(self._variable)
-        if variable_name in self._variables:
+        if (variable_name, type_name) in self._variables:
             return
-        self._variables.add(variable_name)
+        self._variables.add((variable_name, type_name))
         self.l('{variable}_len = len({variable})')
 
-    def create_variable_keys(self):
-        """
-        Create variable keys.
-
-        Append code for creating variable with keys of that variable (dictionary)
-        with name ``{variable}_len``. It can be called several times and always
-        it's done only when that variable still does not exists.
-        """
-        variable_name = '{}_keys'.format(self._variable)
-        if variable_name in self._variables:
-            return
-        self._variables.add(variable_name)
-        self.l('{variable}_keys = set({variable}.keys())')
-
     def generate_func_code(self):
         """Generate all functions that are referenced and not yet generated."""
         self.l('NoneType = type(None)')
+        if self._config.batch:
+            self.generate_batch_function()
         while self._needed_validation_functions:
             # During generation of validation function, could be needed to generate
             # new one that is added again to `_needed_validation_functions`.
             # Therefore usage of while instead of for loop.
-            uri, name = self._needed_validation_functions.popitem()
-            self.generate_validation_function(uri, name)
+            key, function = self._needed_validation_functions.popitem()
+            self._validation_functions_done.add(key)
+            self.generate_validation_function(*function)
+
+    # pylint: disable=too-many-arguments
+    def generate_validation_function(self, name, mode, uri=None, definition=None, state=None, schema_path=None):
+        """
+        Generate validation function with given name.
 
-    def generate_validation_function(self, uri, name):
-        """Generate validation function for given uri with given name."""
-        self._validation_functions_done.add(uri)
+        Function validates definition of given uri or given definition in
+        given resolver state. In ``exception`` mode function returns data,
+        in ``boolean`` mode ``True`` or ``False`` and in ``errors`` mode
+        list of errors.
+        """
+        backup = self._function_name, self._mode, self._schema_path, self._path
+        self._function_name, self._mode, self._path = name, mode, ()
+        self.l('')
+        if uri is not None:
+            self._schema_path = self._get_schema_path(uri)
+            self._generated_refs.add(uri)
+            with self._resolver.resolving(uri) as definition:
+                self._generate_validation_function_body(name, definition)
+            self._generated_refs.discard(uri)
+        else:
+            self._schema_path = schema_path
+            with self._resolver.in_state(state):
+                self._generate_validation_function_body(name, definition)
+        self._function_name, self._mode, self._schema_path, self._path = backup
+
+    def generate_batch_function(self):
+        """
+        Generate function validating list of documents by main schema.
+
+        It returns only failures, list of tuples with index of invalid document and
+        exception in ``exception`` mode or list of errors in ``errors`` mode, and list
+        of indexes in ``boolean`` mode. In ``exception`` mode validation rules are
+        inlined directly in the loop, so there is no function call for each document.
+        """
+        uri, main_function_name = self._resolver.get_scope_name()
+        name = self._get_function_name(('batch',), main_function_name + '_batch')
+        self._batch_function_name = name
         self.l('')
-        with self._resolver.resolving(uri) as definition:
-            with self.l('def {}(data):', name):
+        with self.l('def {}(items):', name):
+            if self._mode == 'boolean':
+                self.l('return [index for index, data in enumerate(items) if not {}(data)]', main_function_name)
+                return
+            self.l('failures = []')
+            with self.l('for index, data in enumerate(items):'):
+                if self._mode == 'errors':
+                    self.l('errors = {}(data)', main_function_name)
+                    with self.l('if errors:'):
+                        self.l('failures.append((index, errors))')
+                else:
+                    self._generate_batch_loop_body(name, uri)
+            self.l('return failures')
+
+    def _generate_batch_loop_body(self, name, uri):
+        backup = self._function_name, self._schema_path
+        self._function_name, self._schema_path = name, self._get_schema_path(uri)
+        with self.l('try:'):
+            code_length = len(self._code)
+            with self._resolver.resolving(uri) as definition:
+                self.generate_func_code_block(definition, 'data', 'data', clear_variables=True)
+            if len(self._code) == code_length:
+                self.l('pass')
+        with self.l('except JsonSchemaException as error:'):
+            self.l('failures.append((index, error))')
+        self._function_name, self._schema_path = backup
+
+    def _get_schema_path(self, uri):
+        """Return JSON pointer of schema ``uri``, relative one for the main schema."""
+        document, fragment = urldefrag(uri)
+        if document == self._resolver.base_uri:
+            return '#' + fragment
+        return uri
+
+    def _generate_validation_function_body(self, name, definition):
+        if self._mode == 'errors':
+            with self.l('def {}(data, errors=None, path=()):', name):
+                if name == self._main_function_name:
+                    self._generate_errors_list(name)
                 self.generate_func_code_block(definition, 'data', 'data', clear_variables=True)
+                self.l('return errors')
+            return
+        with self.l('def {}(data):', name):
+            self.generate_func_code_block(definition, 'data', 'data', clear_variables=True)
+            if self._mode == 'boolean':
+                self.l('return True')
+            else:
                 self.l('return data')
 
-    def generate_func_code_block(self, definition, variable, variable_name, clear_variables=False):
-        """Create validation rules for current definition."""
-        backup = self._definition, self._variable, self._variable_name
+    def _generate_errors_list(self, name):
+        """Create list of errors when main function is called directly."""
+        with self.l('if errors is None:'):
+            self.l('errors = []')
+            if self._config.max_errors:
+                with self.l('try:'):
+                    self.l('{}(data, errors, path)', name)
+                with self.l('except MaxErrorsReached:'):
+                    self.l('pass')
+                self.l('return errors')
+
+    # pylint: disable=too-many-arguments
+    def generate_func_code_block(
+            self,
+            definition,
+            variable,
+            variable_name,
+            clear_variables=False,
+            path=None,
+            schema_path=(),
+    ):
+        """
+        Create validation rules for current definition.
+
+        Where ``path`` is code of key or index of ``variable`` in current variable
+        and ``schema_path`` keys of ``definition`` in current definition, both are
+        used for reporting errors in ``errors`` mode.
+        """
+        backup = self._definition, self._variable, self._variable_name, self._variable_type
+        if variable != self._variable:
+            self._variable_type = None
         self._definition, self._variable, self._variable_name = definition, variable, variable_name
+        backup_paths = self._keyword, self._schema_path, self._path
+        self._schema_path = self._schema_path + ''.join('/' + _escape_pointer(key) for key in schema_path)
+        self._keyword = None
+        if path is not None:
+            self._path = self._path + (path,)
         if clear_variables:
             backup_variables = self._variables
             self._variables = set()
@@ -241,14 +554,127 @@ class CodeGenerator(object):
             # needed because ref overrides any sibling keywords
             self.generate_ref()
         else:
-            for key, func in self._json_keywords_to_function.items():
-                if key in definition:
-                    func()
-
-        self._definition, self._variable, self._variable_name = backup
+            keywords = [key for key in self._json_keywords_to_function if key in definition]
+            if self._config.order_by_cost and not self._has_defaults(definition):
+                keywords = self._order_by_cost(keywords)
+            for is_typed, group in groupby(keywords, lambda key: key in self.TYPE_KEYWORDS):
+                if is_typed:
+                    self._generate_type_dispatch(list(group))
+                else:
+                    self._generate_keywords(group)
+
+        self._definition, self._variable, self._variable_name, self._variable_type = backup
+        self._keyword, self._schema_path, self._path = backup_paths
         if clear_variables:
             self._variables = backup_variables
 
+    def _order_by_cost(self, keywords):
+        """
+        Return ``keywords`` ordered by :any:`KEYWORD_COSTS` and observed failures.
+
+        Keywords of same cost are ordered from the most often failing one, keywords
+        which apply to any type before type specific ones, so those can be still
+        grouped, and the rest keeps default order. Only ``uniqueItems`` has to stay
+        after ``items``, which could have validated types of items.
+        """
+        frequencies = self._config.failure_frequencies or {}
+        max_cost = max(self.KEYWORD_COSTS.values()) + 1
+        keywords = sorted(keywords, key=lambda key: (
+            self.KEYWORD_COSTS.get(key, max_cost),
+            -frequencies.get(key, 0),
+            key in self.TYPE_KEYWORDS,
+        ))
+        if 'items' in keywords and 'uniqueItems' in keywords:
+            keywords.remove('uniqueItems')
+            keywords.insert(keywords.index('items') + 1, 'uniqueItems')
+        return keywords
+
+    def _has_defaults(self, definition, visited_refs=None):
+        """
+        Return True if ``definition`` or any of its subdefinitions fills in default values.
+
+        Defaults change validated data, so order of keywords matters. Subdefinitions
+        are searched also through references, each referenced URI only once.
+        """
+        visited_refs = set() if visited_refs is None else visited_refs
+        if isinstance(definition, list):
+            return any(self._has_defaults(item, visited_refs) for item in definition)
+        if not isinstance(definition, dict):
+            return False
+        if isinstance(definition.get('$ref'), str):
+            with self._resolver.in_scope(definition['$ref']):
+                uri = normalize(self._resolver.resolution_scope)
+                if uri in visited_refs:
+                    return False
+                visited_refs.add(uri)
+                with self._resolver.resolving(uri) as resolved_definition:
+                    return self._has_defaults(resolved_definition, visited_refs)
+        properties = definition.get('properties')
+        if isinstance(properties, dict) and any(
+                isinstance(item, dict) and 'default' in item for item in properties.values()
+        ):
+            return True
+        items = definition.get('items')
+        if isinstance(items, list) and any(isinstance(item, dict) and 'default' in item for item in items):
+            return True
+        return any(
+            self._has_defaults(definition[key], visited_refs)
+            for key in _SUBDEFINITION_KEYWORDS if key in definition
+        ) or any(
+            self._has_defaults(item, visited_refs)
+            for key in _SUBDEFINITION_MAPPING_KEYWORDS if isinstance(definition.get(key), dict)
+            for item in definition[key].values()
+        )
+
+    def _generate_type_dispatch(self, keywords):
+        """
+        Generate validation of ``keywords`` which apply only to values of some type.
+
+        Keywords are grouped by type, so type of variable is checked only once for
+        all of them, and groups are exclusive branches of one ``if``/``elif``.
+        When type is already known, only keywords of that type are generated
+        without any check.
+
+        .. code-block:: python
+
+            if isinstance(data, str):
+                # minLength, maxLength, pattern
+            elif isinstance(data, (int, float)):
+                # minimum, maximum
+        """
+        groups = OrderedDict()
+        for key in keywords:
+            groups.setdefault(self.TYPE_KEYWORDS[key], []).append(key)
+        if self._variable_type:
+            self._generate_keywords(groups.get(self._variable_type, []))
+            return
+        statement = 'if'
+        for type_name, type_keywords in groups.items():
+            code_length = len(self._code)
+            with self.l('{} isinstance({variable}, {}):', statement, self.TYPE_CHECKS[type_name]):
+                self._variable_type = type_name
+                self._generate_keywords(type_keywords)
+                self._variable_type = None
+            if len(self._code) == code_length + 1:
+                # keywords like uniqueItems False don't generate any code
+                self._code.pop()
+            else:
+                statement = 'elif'
+
+    def _generate_keywords(self, keywords):
+        for key in keywords:
+            self._keyword = key
+            self._json_keywords_to_function[key]()
+
+    @contextmanager
+    def _type_guard(self, type_name):
+        """Generate check of type of current variable around block unless the type is already known."""
+        if self._variable_type == type_name:
+            yield
+        else:
+            with self.l('if isinstance({variable}, {}):', self.TYPE_CHECKS[type_name]):
+                yield
+
     def generate_ref(self):
         """
         Ref can be link to remote or local definition.
@@ -264,24 +690,93 @@ class CodeGenerator(object):
             }
         """
         with self._resolver.in_scope(self._definition['$ref']):
+            uri = normalize(self._resolver.resolution_scope)
+            with self._resolver.resolving(uri) as definition:
+                if self._can_inline_ref(uri, definition):
+                    self._generate_inlined_ref(uri, definition)
+                    return
             function_name = self._generate_function_from_scope()
-            self.l('{}({variable})', function_name)
+            if self._mode == 'boolean':
+                with self.l('if not {}({variable}):', function_name):
+                    self.exc('{name} must be valid by reference')
+            elif self._mode == 'errors':
+                self.l('{}({variable}, errors, {})', function_name, self._path_code())
+            else:
+                self.l('{}({variable})', function_name)
+
+    def _can_inline_ref(self, uri, definition):
+        """
+        Return True if referenced ``definition`` can be generated in place of reference.
 
+        Only definitions not bigger than ``Config(ref_inline_limit=...)`` are inlined
+        and never one which is already generated, so recursive reference is always
+        a call of function.
+        """
+        return (
+            bool(self._config.ref_inline_limit)
+            and uri not in self._generated_refs
+            and _get_definition_size(definition) <= self._config.ref_inline_limit
+        )
+
+    def _generate_inlined_ref(self, uri, definition):
+        backup = self._schema_path
+        self._schema_path = self._get_schema_path(uri)
+        self._generated_refs.add(uri)
+        code_length = len(self._code)
+        # messages are same as from function of referenced definition
+        self.generate_func_code_block(definition, self._variable, 'data', clear_variables=True)
+        if len(self._code) == code_length:
+            self.l('pass')
+        self._generated_refs.discard(uri)
+        self._schema_path = backup
+
+    def _generate_function_from_scope(self):
+        """
+        Add function of current scope to generation queue if needed and return function name.
+
+        :rtype: str: Name of function
+        """
+        uri, function_name = self._resolver.get_scope_name()
+        key = (uri, self._mode)
+        function_name = self._get_function_name(key, function_name)
+        if key not in self._validation_functions_done:
+            self._needed_validation_functions[key] = (function_name, self._mode, uri)
+        return function_name
 
-    def _generate_function_from_scope(self, definition=None, postfix=''):
+    def _generate_function_from_definition(self, definition, postfix, mode=None):
         """
-        Add function to generation queue if needed and return function name.
+        Add function validating ``definition`` to generation queue and return function name.
 
-        :argument str postfix: postfix for fucmtion name.
+        Function is generated in current resolver state, so references are resolved
+        same way as they would be in place of ``definition``.
+
+        :argument str postfix: postfix for function name.
+        :argument str mode: mode of function, current one by default.
         :rtype: str: Name of function
         """
-        uri, function_name = self._resolver.get_scope_name(postfix)
-        if uri not in self._validation_functions_done:
-            self._needed_validation_functions[uri] = function_name
-            if definition:
-                self._resolver.uri_cache[uri] = definition
+        key = object()
+        function_name = self._get_function_name(key, '{}__{}'.format(self._function_name, postfix))
+        self._needed_validation_functions[key] = (
+            function_name,
+            mode or self._mode,
+            None,
+            definition,
+            self._resolver.get_state(),
+            self._get_keyword_pointer(),
+        )
         return function_name
 
+    def _get_function_name(self, key, name):
+        """Return unique function name for function identified by ``key``."""
+        if key not in self._function_names:
+            function_name, index = name, 0
+            while function_name in self._used_function_names:
+                index += 1
+                function_name = '{}_{}'.format(name, index)
+            self._function_names[key] = function_name
+            self._used_function_names.add(function_name)
+        return self._function_names[key]
+
     def generate_type(self):
         """
         Generate validation for type. Can be one type or list of types.
@@ -291,9 +786,13 @@ class CodeGenerator(object):
             {'type': 'string'}
             {'type': ['string', 'number']}
         """
-        if_statement, raise_statement = self._type_resolver.type_definition_list(self._definition['type'])
+        if_statement, message = self._type_resolver.type_definition_list(self._definition['type'])
         with self.l(if_statement):
-            self.l(raise_statement)
+            self.exc(message)
+        groups = {self.JSON_TYPE_GROUPS.get(type_) for type_ in enforce_list(self._definition['type'])}
+        if self._mode != 'errors' and len(groups) == 1:
+            # invalid value doesn't get to following keywords
+            self._variable_type = groups.pop()
 
     def generate_enum(self):
         """
@@ -305,8 +804,49 @@ class CodeGenerator(object):
                 'enum': ['a', 'b'],
             }
         """
-        with self.l('if {variable} not in {enum}:'):
-            self.l('raise JsonSchemaException("{name} must be one of {enum}")')
+        with self.l('if {}:', self._get_not_equal_condition(self._definition['enum'], 'ENUM')):
+            self.exc('{name} must be one of {enum}')
+
+    def _get_not_equal_condition(self, values, prefix):
+        """
+        Return condition which is true when current variable is not equal to any of ``values``.
+
+        Booleans are compared by identity, because ``True == 1`` in Python but not
+        in JSON schema. Hashable values are looked up in frozenset (or compared
+        directly when there is only one) and lists and dictionaries are looked up
+        by keys made by :any:`fastjsonschema.utils.unique_key`, so nested booleans
+        are not equal to numbers either. Sets are precomputed on module level with
+        names starting with ``prefix``.
+        """
+        variable = self._variable
+        conditions = []
+        scalars = [value for value in values if not isinstance(value, (bool, list, dict))]
+        if scalars:
+            if all(isinstance(value, str) for value in scalars):
+                type_condition = 'isinstance({}, str)'.format(variable)
+            else:
+                type_condition = 'not isinstance({}, (bool, list, dict))'.format(variable)
+            if len(scalars) == 1:
+                conditions.append('{} and {} == {!r}'.format(type_condition, variable, scalars[0]))
+            else:
+                constant_name = self.create_global_constant(prefix, 'frozenset({!r})'.format(scalars))
+                conditions.append('{} and {} in {}'.format(type_condition, variable, constant_name))
+        for value in (True, False):
+            if any(item is value for item in values):
+                conditions.append('{} is {!r}'.format(variable, value))
+        structures = [value for value in values if isinstance(value, (list, dict))]
+        if structures:
+            self.import_function('fastjsonschema.utils', 'unique_key')
+            constant_name = self.create_global_constant(prefix, 'frozenset(map(unique_key, {!r}))'.format(
+                tuple(structures),
+            ))
+            conditions.append('isinstance({}, (list, dict)) and unique_key({}) in {}'.format(
+                variable, variable, constant_name))
+        if not conditions:
+            return 'True'
+        if len(conditions) == 1:
+            return 'not ({})'.format(conditions[0])
+        return 'not ({})'.format(' or '.join('({})'.format(condition) for condition in conditions))
 
     def generate_all_of(self):
         """
@@ -326,8 +866,14 @@ class CodeGenerator(object):
 
         Valid values for this definition are 5, 6, 7, ... but not 4 or 'abc' for example.
         """
-        for definition_item in self._definition['allOf']:
-            self.generate_func_code_block(definition_item, self._variable, self._variable_name, clear_variables=True)
+        for index, definition_item in enumerate(self._definition['allOf']):
+            self.generate_func_code_block(
+                definition_item,
+                self._variable,
+                self._variable_name,
+                clear_variables=True,
+                schema_path=('allOf', index),
+            )
 
     def generate_any_of(self):
         """
@@ -347,21 +893,24 @@ class CodeGenerator(object):
 
         Valid values for this definition are 3, 4, 5, 10, 11, ... but not 8 for example.
         """
-        self.l('{variable}_any_of_count = 0')
-        for definition_item in self._definition['anyOf']:
-            with self.l('if not {variable}_any_of_count:'):
-                with self.l('try:'):
-                    self.generate_func_code_block(
-                        definition_item,
-                        self._variable,
-                        self._variable_name,
-                        clear_variables=True
-                    )
-                    self.l('{variable}_any_of_count += 1')
-                self.l('except JsonSchemaException: pass')
-
-        with self.l('if not {variable}_any_of_count:'):
-            self.l('raise JsonSchemaException("{name} must be valid by one of anyOf definition")')
+        # boolean functions, so invalid definitions don't raise exceptions
+        function_names = [
+            self._generate_function_from_definition(definition_item, 'any_of_{}'.format(index), 'boolean')
+            for index, definition_item in enumerate(self._definition['anyOf'])
+        ]
+        order = self._get_branches_order(len(function_names))
+        if self._config.profile_branches:
+            statement = 'if'
+            for index in order:
+                with self.l('{} {}({variable}):', statement, function_names[index]):
+                    self._generate_branch_count(index, len(function_names))
+                statement = 'elif'
+            with self.l('else:'):
+                self.exc('{name} must be valid by one of anyOf definition')
+            return
+        calls = ' or '.join('{}({})'.format(function_names[index], self._variable) for index in order)
+        with self.l('if not ({}):', calls):
+            self.exc('{name} must be valid by one of anyOf definition')
 
     def generate_one_of(self):
         """
@@ -380,21 +929,147 @@ class CodeGenerator(object):
             }
 
         Valid values for this definitions are 3, 5, 6, ... but not 15 for example.
+
+        Validation stops with the second valid definition. When every definition
+        requires the same property with a different string value (tagged union),
+        objects are dispatched by value of that property to the only definition
+        which can be valid:
+
+        .. code-block:: python
+
+            {
+                'oneOf': [
+                    {'properties': {'kind': {'const': 'a'}}, 'required': ['kind']},
+                    {'properties': {'kind': {'const': 'b'}}, 'required': ['kind']},
+                ],
+            }
         """
+        discriminator = self._get_one_of_discriminator()
+        function_names = None
+        if self._mode != 'exception' or discriminator:
+            function_names = [
+                self._generate_function_from_definition(definition_item, 'one_of_{}'.format(index), 'boolean')
+                for index, definition_item in enumerate(self._definition['oneOf'])
+            ]
+        if not discriminator:
+            self._generate_one_of_branches(function_names)
+        else:
+            property_name, values = discriminator
+            functions_map = self.create_function_map('ONE_OF', dict(zip(values, function_names)))
+            with self.l('if isinstance({variable}, dict):'):
+                self.l('{variable}_one_of_key = {variable}[{0}] if {0} in {variable} else None', repr(property_name))
+                with self.l(
+                        'if not (isinstance({variable}_one_of_key, str) and {variable}_one_of_key in {0}'
+                        ' and {0}[{variable}_one_of_key]({variable})):',
+                        functions_map,
+                ):
+                    self.exc('{name} must be valid exactly by one of oneOf definition')
+            with self.l('else:'):
+                self._generate_one_of_branches(function_names)
+
+    def _generate_one_of_branches(self, function_names):
+        """Generate validation of all oneOf definitions, inlined ones when no ``function_names`` are given."""
+        definitions = self._definition['oneOf']
+        order = self._get_branches_order(len(definitions))
         self.l('{variable}_one_of_count = 0')
-        for definition_item in self._definition['oneOf']:
-            with self.l('try:'):
-                self.generate_func_code_block(
-                    definition_item,
-                    self._variable,
-                    self._variable_name,
-                    clear_variables=True
-                )
-                self.l('{variable}_one_of_count += 1')
-            self.l('except JsonSchemaException: pass')
+        if function_names:
+            for position, index in enumerate(order):
+                with self.l('if {}({variable}):', function_names[index]):
+                    if position:
+                        # second valid definition, no need to continue
+                        with self.l('if {variable}_one_of_count:'):
+                            self.exc('{name} must be valid exactly by one of oneOf definition')
+                    self.l('{variable}_one_of_count = 1')
+                    self._generate_branch_count(index, len(definitions))
+            with self.l('if not {variable}_one_of_count:'):
+                self.exc('{name} must be valid exactly by one of oneOf definition')
+            return
+        for position, index in enumerate(order):
+            if position > 1:
+                # after two valid definitions the result is known
+                with self.l('if {variable}_one_of_count < 2:'):
+                    self._generate_one_of_branch(definitions, index)
+            else:
+                self._generate_one_of_branch(definitions, index)
 
         with self.l('if {variable}_one_of_count != 1:'):
-            self.l('raise JsonSchemaException("{name} must be valid exactly by one of oneOf definition")')
+            self.exc('{name} must be valid exactly by one of oneOf definition')
+
+    def _generate_one_of_branch(self, definitions, index):
+        pointer = self._get_keyword_pointer()
+        with self.l('try:'):
+            self.generate_func_code_block(
+                definitions[index],
+                self._variable,
+                self._variable_name,
+                clear_variables=True
+            )
+            self.l('{variable}_one_of_count += 1')
+            self._generate_branch_count(index, len(definitions), pointer)
+        self.l('except JsonSchemaException: pass')
+
+    def _get_branches_order(self, count):
+        """
+        Return indexes of ``count`` definitions of current keyword in order they are tried.
+
+        Definitions which were valid most often by ``Config(branch_profile=...)``
+        are tried first, default order is used when there is no profile for them.
+        """
+        counts = (self._config.branch_profile or {}).get(self._get_keyword_pointer())
+        order = list(range(count))
+        if isinstance(counts, list) and len(counts) == count:
+            order.sort(key=lambda index: -counts[index])
+        return order
+
+    def _generate_branch_count(self, index, count, pointer=None):
+        """Generate counting of valid definition ``index`` of current keyword with ``Config(profile_branches=True)``."""
+        if not self._config.profile_branches:
+            return
+        pointer = pointer or self._get_keyword_pointer()
+        self._branch_profile[pointer] = count
+        self.l('BRANCH_PROFILE[{}][{}] += 1', repr(pointer), index)
+
+    def _get_keyword_pointer(self):
+        """Return JSON pointer of current keyword in schema."""
+        return self._schema_path + '/' + _escape_pointer(self._keyword)
+
+    def _get_one_of_discriminator(self):
+        """
+        Return property which value selects the only possibly valid definition of oneOf.
+
+        Every definition has to require the property and allow only one string value
+        of it (by ``const`` or ``enum``), different for each definition. Returns tuple
+        of property name and values in order of definitions or ``None``.
+        """
+        definitions = self._definition['oneOf']
+        if len(definitions) < 2 or not all(
+                isinstance(item, dict) and '$ref' not in item
+                and isinstance(item.get('properties'), dict) and isinstance(item.get('required'), list)
+                for item in definitions
+        ):
+            return None
+        for property_name in definitions[0]['properties']:
+            values = [self._get_single_string_value(item, property_name) for item in definitions]
+            if None not in values and len(set(values)) == len(values):
+                return property_name, values
+        return None
+
+    def _get_single_string_value(self, definition, property_name):
+        """Return only string value allowed for required ``property_name`` by ``definition`` or ``None``."""
+        if property_name not in definition['required']:
+            return None
+        property_definition = definition['properties'].get(property_name)
+        if not isinstance(property_definition, dict) or '$ref' in property_definition:
+            return None
+        values = []
+        if 'const' in property_definition and 'const' in self._json_keywords_to_function:
+            values.append(property_definition['const'])
+        enum = property_definition.get('enum')
+        if isinstance(enum, list) and len(enum) == 1:
+            values.append(enum[0])
+        if values and isinstance(values[0], str) and all(value == values[0] for value in values):
+            return values[0]
+        return None
 
     def generate_not(self):
         """
@@ -411,13 +1086,17 @@ class CodeGenerator(object):
         not_definition = self._definition['not']
         if not_definition is True:
             # boolean schema True
-            self.l('raise JsonSchemaException("{name} must not be valid by not definition")')
+            self.exc('{name} must not be valid by not definition')
         elif not_definition is False:
             # boolean schema False
             pass
         elif not not_definition:
             with self.l('if {}:', self._variable):
-                self.l('raise JsonSchemaException("{name} must not be valid by not definition")')
+                self.exc('{name} must not be valid by not definition')
+        elif self._mode != 'exception':
+            function_name = self._generate_function_from_definition(not_definition, 'not', 'boolean')
+            with self.l('if {}({variable}):', function_name):
+                self.exc('{name} must not be valid by not definition')
         else:
             with self.l('try:'):
                 self.generate_func_code_block(not_definition, self._variable, self._variable_name)
@@ -426,142 +1105,173 @@ class CodeGenerator(object):
 
     def generate_min_length(self):
         """Validate min length."""
-        with self.l('if isinstance({variable}, str):'):
-            self.create_variable_with_length()
+        with self._type_guard('str'):
+            self.create_variable_with_length('str')
             with self.l('if {variable}_len < {minLength}:'):
-                self.l('raise JsonSchemaException("{name} must be longer than or equal to {minLength} characters")')
+                self.exc('{name} must be longer than or equal to {minLength} characters')
 
     def generate_max_length(self):
         """Validate max length."""
-        with self.l('if isinstance({variable}, str):'):
-            self.create_variable_with_length()
+        with self._type_guard('str'):
+            self.create_variable_with_length('str')
             with self.l('if {variable}_len > {maxLength}:'):
-                self.l('raise JsonSchemaException("{name} must be shorter than or equal to {maxLength} characters")')
+                self.exc('{name} must be shorter than or equal to {maxLength} characters')
 
     def generate_pattern(self):
         """Gnerate validator for pattern definition."""
-        with self.l('if isinstance({variable}, str):'):
+        with self._type_guard('str'):
             pattern = self._definition['pattern']
             if not pattern in self._compile_regexps:
                 self._compile_regexps[pattern] = re.compile(pattern)
             with self.l('if not REGEX_PATTERNS["{}"].search({variable}):', pattern):
-                self.l('raise JsonSchemaException("{name} must match pattern {pattern}")')
+                self.exc('{name} must match pattern {pattern}')
 
     def generate_format(self):
-        """Gnerate validator for format definition."""
-        with self.l('if isinstance({variable}, str):'):
+        """
+        Gnerate validator for format definition.
+
+        Regular expressions and functions of formats are bound to module level names
+        when generated module is loaded, so validation calls them directly. With
+        ``Config(format_cache_size=...)`` results are cached by :any:`FormatManager.get_cached_function`.
+        """
+        with self._type_guard('str'):
             format_ = self._definition['format']
             format_regexs = self._resolver.meta_schema.format_regexs
-            if format_ in format_regexs:
-                self._generate_format(format_)
             format_functions = self._resolver.meta_schema.format_functions
+            if self._config.format_cache_size and (format_ in format_regexs or format_ in format_functions):
+                self.import_function('fastjsonschema.formats', 'format_manager')
+                function_name = self.create_global_constant(
+                    'FORMAT',
+                    'format_manager.get_cached_function({!r}, {!r})'.format(format_, self._config.format_cache_size),
+                )
+                with self.l('if not {}({variable}):', function_name):
+                    if format_ in format_regexs:
+                        self.exc('{name} must be {}', format_)
+                    else:
+                        self.exc('{name} must be a valid {}', format_)
+                return
+            if format_ in format_regexs:
+                self.import_function('fastjsonschema.formats', 'format_manager')
+                regex_name = self.create_global_constant('FORMAT', 'format_manager.get_function({!r})'.format(format_))
+                with self.l('if not {}.match({variable}):', regex_name):
+                    self.exc('{name} must be {}', format_)
             if format_ in format_functions:
-                self.l('is_format = format_resolver.get_function("{}")', format_)
-                with self.l('if not is_format({variable}):'):
-                    self.l('raise JsonSchemaException("{name} must be a valid {}")', format_)
-
-    def _generate_format(self, format_name):
-        if self._definition['format'] == format_name:
-            self.l('regex = format_resolver.get_function("{}")', format_name)
-            with self.l('if not regex.match({variable}):'):
-                self.l('raise JsonSchemaException("{name} must be {}")', format_name)
+                function = format_functions[format_]
+                self.import_function(function.__module__, function.__name__)
+                with self.l('if not {}({variable}):', function.__name__):
+                    self.exc('{name} must be a valid {}', format_)
 
     def generate_minimum(self):
         """Validate min."""
-        with self.l('if isinstance({variable}, (int, float)):'):
+        with self._type_guard('number'):
             # check for draft-04 version of exclusiveMinimum
             if self._definition.get('exclusiveMinimum', False):
                 with self.l('if {variable} <= {minimum}:'):
-                    self.l('raise JsonSchemaException("{name} must be bigger than {minimum}")')
+                    self.exc('{name} must be bigger than {minimum}')
             else:
                 with self.l('if {variable} < {minimum}:'):
-                    self.l('raise JsonSchemaException("{name} must be bigger than or equal to {minimum}")')
+                    self.exc('{name} must be bigger than or equal to {minimum}')
 
     def generate_maximum(self):
         """Validate max."""
-        with self.l('if isinstance({variable}, (int, float)):'):
+        with self._type_guard('number'):
             # check for draft-04 version of exclusiveMaximum
             if self._definition.get('exclusiveMaximum', False):
                 with self.l('if {variable} >= {maximum}:'):
-                    self.l('raise JsonSchemaException("{name} must be smaller than {maximum}")')
+                    self.exc('{name} must be smaller than {maximum}')
             else:
                 with self.l('if {variable} > {maximum}:'):
-                    self.l('raise JsonSchemaException("{name} must be smaller than or equal to {maximum}")')
+                    self.exc('{name} must be smaller than or equal to {maximum}')
 
     def generate_exclusive_minimum(self):
         """Check for draft-06 and draft-07 version of exclusiveMinimum."""
-        with self.l('if isinstance({variable}, (int, float)):'):
+        with self._type_guard('number'):
             with self.l('if {variable} <= {exclusiveMinimum}:'):
-                self.l('raise JsonSchemaException("{name} must be bigger than {exclusiveMinimum}")')
+                self.exc('{name} must be bigger than {exclusiveMinimum}')
 
     def generate_exclusive_maximum(self):
         """Check for draft-06 and draft-07 version of exclusiveMaximum."""
-        with self.l('if isinstance({variable}, (int, float)):'):
+        with self._type_guard('number'):
             with self.l('if {variable} >= {exclusiveMaximum}:'):
-                self.l('raise JsonSchemaException("{name} must be smaller than {exclusiveMaximum}")')
+                self.exc('{name} must be smaller than {exclusiveMaximum}')
 
     def generate_multiple_of(self):
         """Validate multipleOf definition."""
-        with self.l('if isinstance({variable}, (int, float)):'):
+        with self._type_guard('number'):
             self.l('quotient = {variable} / {multipleOf}')
             with self.l('if int(quotient) != quotient:'):
-                self.l('raise JsonSchemaException("{name} must be multiple of {multipleOf}")')
+                self.exc('{name} must be multiple of {multipleOf}')
 
     def generate_min_items(self):
         """Validate min items."""
-        with self.l('if isinstance({variable}, list):'):
-            self.create_variable_with_length()
+        with self._type_guard('list'):
+            self.create_variable_with_length('list')
             with self.l('if {variable}_len < {minItems}:'):
-                self.l('raise JsonSchemaException("{name} must contain at least {minItems} items")')
+                self.exc('{name} must contain at least {minItems} items')
 
     def generate_max_items(self):
         """Validate max items."""
-        with self.l('if isinstance({variable}, list):'):
-            self.create_variable_with_length()
+        with self._type_guard('list'):
+            self.create_variable_with_length('list')
             with self.l('if {variable}_len > {maxItems}:'):
-                self.l('raise JsonSchemaException("{name} must contain less than or equal to {maxItems} items")')
+                self.exc('{name} must contain less than or equal to {maxItems} items')
 
     def generate_unique_items(self):
         """
-        Generate valiudator for item definitions.
+        Generate validator for uniqueItems definition.
+
+        Items are compared by JSON schema equality using hashable keys made by
+        :any:`fastjsonschema.utils.unique_key` and checking stops on first duplicate.
+        When items are already validated to be only strings or only numbers, they are
+        hashable and equal same way as in Python and simple set is enough.
 
-        With Python 3.4 module ``timeit`` recommended this solutions:
+        Previous implementation comparing ``str`` of items was slower and wrong
+        for items like ``1`` and ``True``:
 
         .. code-block:: python
 
-            >>> timeit.timeit("len(x) > len(set(x))", "x=range(100)+range(100)", number=100000)
-            0.5839540958404541
-            >>> timeit.timeit("len({}.fromkeys(x)) == len(x)", "x=range(100)+range(100)", number=100000)
-            0.7094449996948242
-            >>> timeit.timeit(
-                "seen = set(); any(i in seen or seen.add(i) for i in x)",
-                "x=range(100)+range(100)",
-                number=100000
-            )
-            2.0819358825683594
-            >>> timeit.timeit(
-                "np.unique(x).size == len(x)",
-                "x=range(100)+range(100); import numpy as np",
-                number=100000
-            )
-            2.1439831256866455
+            >>> timeit.timeit("len(x) > len(set(x))", "x=list(range(10000))", number=1000)
+            0.18916666299992357
+            >>> timeit.timeit("has_duplicates(x)", "x=list(range(10000))", number=1000)
+            0.1918283220002195
+            >>> timeit.timeit("len(x) > len(set(str(i) for i in x))", "x=list(range(10000))", number=1000)
+            1.801661508000052
+        """
+        if not self._definition['uniqueItems']:
+            return
+        with self._type_guard('list'):
+            if self._are_items_hashable():
+                self.create_variable_with_length('list')
+                with self.l('if {variable}_len > len(set({variable})):'):
+                    self.exc('{name} must contain unique items')
+            else:
+                self.import_function('fastjsonschema.utils', 'has_duplicates')
+                with self.l('if has_duplicates({variable}):'):
+                    self.exc('{name} must contain unique items')
+
+    def _are_items_hashable(self):
         """
-        self.create_variable_with_length()
-        with self.l('if {variable}_len > len(set(str(x) for x in {variable})):'):
-            self.l('raise JsonSchemaException("{name} must contain unique items")')
+        Return True if items are validated to be only strings or only numbers before uniqueItems.
+
+        Not in ``errors`` mode which continues with validation even when items are invalid.
+        """
+        items_definition = self._definition.get('items')
+        if self._mode == 'errors' or not isinstance(items_definition, dict) or '$ref' in items_definition:
+            return False
+        return items_definition.get('type') in ('string', 'number', 'integer')
 
     def generate_items(self):
         """Generate valiudator for item definitions."""
         items_definition = self._definition['items']
-        with self.l('if isinstance({variable}, list):'):
-            self.create_variable_with_length()
+        with self._type_guard('list'):
+            self.create_variable_with_length('list')
             if items_definition is True:
                 # boolean schema True
                 self.l('pass')
             elif items_definition is False:
                 # boolean schema False
                 with self.l('if {variable}:'):
-                    self.l('raise JsonSchemaException("{name} with False boolean schema")')
+                    self.exc('{name} with False boolean schema')
             elif isinstance(items_definition, list):
                 for x, item_definition in enumerate(items_definition):
                     with self.l('if {variable}_len > {}:', x):
@@ -570,14 +1280,17 @@ class CodeGenerator(object):
                             item_definition,
                             '{}_{}'.format(self._variable, x),
                             '{}[{}]'.format(self._variable_name, x),
+                            path=str(x),
+                            schema_path=('items', x),
                         )
                     if isinstance(item_definition, dict) and 'default' in item_definition:
                         self.l('else: {variable}.append({})', repr(item_definition['default']))
 
                 if 'additionalItems' in self._definition:
+                    self._keyword = 'additionalItems'
                     if self._definition['additionalItems'] is False:
                         with self.l('if {variable}_len > {}:', len(items_definition)):
-                            self.l('raise JsonSchemaException("{name} must contain only specified items")')
+                            self.exc('{name} must contain only specified items')
                     else:
                         with self.l(
                             'for {variable}_x, {variable}_item in enumerate({variable}[{0}:], {0}):',
@@ -587,6 +1300,8 @@ class CodeGenerator(object):
                                 self._definition['additionalItems'],
                                 '{}_item'.format(self._variable),
                                 '{}[{{{}_x}}]'.format(self._variable_name, self._variable),
+                                path='{}_x'.format(self._variable),
+                                schema_path=('additionalItems',),
                             )
             else:
                 if items_definition:
@@ -595,200 +1310,371 @@ class CodeGenerator(object):
                             items_definition,
                             '{}_item'.format(self._variable),
                             '{}[{{{}_x}}]'.format(self._variable_name, self._variable),
+                            path='{}_x'.format(self._variable),
+                            schema_path=('items',),
                         )
 
     def generate_min_properties(self):
         """Validate min properties."""
-        with self.l('if isinstance({variable}, dict):'):
-            self.create_variable_with_length()
+        with self._type_guard('dict'):
+            self.create_variable_with_length('dict')
             with self.l('if {variable}_len < {minProperties}:'):
-                self.l('raise JsonSchemaException("{name} must contain at least {minProperties} properties")')
+                self.exc('{name} must contain at least {minProperties} properties')
 
     def generate_max_properties(self):
         """Validate max properties."""
-        with self.l('if isinstance({variable}, dict):'):
-            self.create_variable_with_length()
+        with self._type_guard('dict'):
+            self.create_variable_with_length('dict')
             with self.l('if {variable}_len > {maxProperties}:'):
-                self.l(
-                    'raise JsonSchemaException("{name} must contain less than '
-                    + 'or equal to {maxProperties} properties")'
-                )
+                self.exc('{name} must contain less than or equal to {maxProperties} properties')
 
     def generate_required(self):
-        """Validate required properties."""
-        with self.l('if isinstance({variable}, dict):'):
-            self.create_variable_with_length()
-            with self.l('if not all(prop in {variable} for prop in {required}):'):
-                self.l('raise JsonSchemaException("{name} must contain {required} properties")')
+        """
+        Validate required properties.
+
+        Few properties are checked one by one, for more of them precomputed set is
+        used. Missing properties are found only when validation fails.
+
+        .. code-block:: python
+
+            {'required': ['a', 'b']}
+        """
+        required = self._definition['required']
+        if not required:
+            return
+        with self._type_guard('dict'):
+            if len(required) <= self.REQUIRED_UNROLL_LIMIT:
+                condition = ' or '.join('{!r} not in {}'.format(prop, self._variable) for prop in required)
+            else:
+                constant_name = self.create_global_constant('REQUIRED', 'frozenset({!r})'.format(required))
+                condition = 'not {}.keys() >= {}'.format(self._variable, constant_name)
+            with self.l('if {}:', condition):
+                if self._mode != 'boolean':
+                    self.l(
+                        '{variable}__missing_keys = [prop for prop in {} if prop not in {variable}]',
+                        repr(required),
+                    )
+                self.exc('{name} must contain " + str({variable}__missing_keys) + " properties')
 
     def generate_properties(self):
-        """Validate properties."""
-        with self.l('if isinstance({variable}, dict):'):
-            self.create_variable_keys()
+        """
+        Validate properties.
+
+        Declared properties are looked up directly in validated dictionary, no copy
+        of its keys is needed, additional properties are found by their own.
+        """
+        with self._type_guard('dict'):
             for key, prop_definition in self._definition['properties'].items():
                 key_name = re.sub(r'($[^a-zA-Z]|[^a-zA-Z0-9])', '', key)
-                with self.l('if "{}" in {variable}_keys:', key):
-                    self.l('{variable}_keys.remove("{}")', key)
+                with self.l('if "{}" in {variable}:', key):
                     self.l('{variable}_{0} = {variable}["{1}"]', key_name, key)
                     self.generate_func_code_block(
                         prop_definition,
                         '{}_{}'.format(self._variable, key_name),
                         '{}.{}'.format(self._variable_name, key),
+                        path=repr(key),
+                        schema_path=('properties', key),
                     )
                 if isinstance(prop_definition, dict) and 'default' in prop_definition:
                     self.l('else: {variable}["{}"] = {}', key, repr(prop_definition['default']))
 
     def generate_pattern_properties(self):
-        """Validate patternProperties."""
-        with self.l('if isinstance({variable}, dict):'):
-            self.create_variable_keys()
-            for pattern, definition in self._definition['patternProperties'].items():
-                self._compile_regexps['{}'.format(pattern)] = re.compile(pattern)
+        """
+        Validate patternProperties.
+
+        Patterns which are just text are checked without regular expression, exact key
+        is looked up directly in dictionary and other keys are checked by ``startswith``,
+        ``endswith`` or ``in`` (see :any:`_classify_pattern`). Other patterns are combined
+        to one regular expression, so keys not matching any of them are skipped by one
+        search (see :any:`_generate_combined_pattern_search`).
+
+        .. code-block:: python
+
+            {'patternProperties': {'^x-': {'type': 'string'}}}
+        """
+        pattern_properties = [
+            (pattern, definition)
+            for pattern, definition in self._definition['patternProperties'].items()
+            if definition is not True and definition != {}
+        ]
+        if not pattern_properties:
+            return
+        with self._type_guard('dict'):
+            text_pattern_properties = []
+            regex_pattern_properties = []
+            for index, (pattern, definition) in enumerate(pattern_properties):
+                kind, text = _classify_pattern(pattern)
+                if kind == 'exact':
+                    self._generate_exact_pattern_property(index, pattern, text, definition)
+                elif kind == 'regex':
+                    regex_pattern_properties.append((pattern, definition))
+                else:
+                    text_pattern_properties.append((pattern, definition))
+            if not text_pattern_properties and not regex_pattern_properties:
+                return
             with self.l('for key, val in {variable}.items():'):
-                for pattern, definition in self._definition['patternProperties'].items():
-                    with self.l('if REGEX_PATTERNS["{}"].search(key):', pattern):
-                        with self.l('if key in {variable}_keys:'):
-                            self.l('{variable}_keys.remove(key)')
-                        self.generate_func_code_block(
-                            definition,
-                            'val',
-                            '{}.{{key}}'.format(self._variable_name),
-                        )
+                for pattern, definition in text_pattern_properties:
+                    with self.l('if {}:', self._get_pattern_condition(pattern, 'key')):
+                        self._generate_pattern_property(pattern, definition)
+                if len(regex_pattern_properties) == 1:
+                    pattern, definition = regex_pattern_properties[0]
+                    with self.l('if {}:', self._get_pattern_condition(pattern, 'key')):
+                        self._generate_pattern_property(pattern, definition)
+                elif regex_pattern_properties:
+                    self._generate_combined_pattern_search(regex_pattern_properties)
+
+    def _generate_pattern_property(self, pattern, definition):
+        """Validate value ``val`` of key ``key`` matching ``pattern``."""
+        code_length = len(self._code)
+        self.generate_func_code_block(
+            definition,
+            'val',
+            '{}.{{key}}'.format(self._variable_name),
+            path='key',
+            schema_path=('patternProperties', pattern),
+        )
+        if len(self._code) == code_length:
+            self.l('pass')
+
+    def _generate_combined_pattern_search(self, pattern_properties):
+        """
+        Validate pattern properties of regular expressions combined to one.
+
+        Patterns are alternatives with named groups, so keys not matching any of them
+        are skipped by one search and pattern which matched is known by name of group.
+        Keys which matched are searched again by each of other patterns, because key
+        can match more of them. Patterns with backreferences or global flags can't
+        be combined.
+        """
+        combinable = [
+            pattern for pattern, _ in pattern_properties
+            if not _UNCOMBINABLE_PATTERN_REGEX.search(pattern)
+        ]
+        group_names = {pattern: 'pattern_{}'.format(index) for index, pattern in enumerate(combinable)}
+        combined_pattern = '|'.join('(?P<{}>{})'.format(group_names[pattern], pattern) for pattern in combinable)
+        try:
+            self._compile_regexps[combined_pattern] = re.compile(combined_pattern)
+        except re.error:
+            group_names = {}
+        if len(group_names) < 2:
+            for pattern, definition in pattern_properties:
+                with self.l('if {}:', self._get_pattern_condition(pattern, 'key')):
+                    self._generate_pattern_property(pattern, definition)
+            return
+        self.l('{variable}__pattern_match = REGEX_PATTERNS["{}"].search(key)', combined_pattern)
+        with self.l('if {variable}__pattern_match is not None:'):
+            self.l('{variable}__pattern_name = {variable}__pattern_match.lastgroup')
+            for pattern, definition in pattern_properties:
+                if pattern in group_names:
+                    with self.l(
+                        'if {variable}__pattern_name == "{}" or {}:',
+                        group_names[pattern],
+                        self._get_pattern_condition(pattern, 'key'),
+                    ):
+                        self._generate_pattern_property(pattern, definition)
+        for pattern, definition in pattern_properties:
+            if pattern not in group_names:
+                with self.l('if {}:', self._get_pattern_condition(pattern, 'key')):
+                    self._generate_pattern_property(pattern, definition)
+
+    def _generate_exact_pattern_property(self, index, pattern, key, definition):
+        """Validate pattern property matching only one ``key``, which is looked up directly."""
+        # index keeps names unique for keys which differ only in removed characters
+        variable = '{}__pattern_{}_{}'.format(self._variable, re.sub(r'[^a-zA-Z0-9]', '', key), index)
+        with self.l('if {} in {variable}:', repr(key)):
+            self.l('{} = {variable}[{}]', variable, repr(key))
+            self.generate_func_code_block(
+                definition,
+                variable,
+                '{}.{}'.format(self._variable_name, key),
+                path=repr(key),
+                schema_path=('patternProperties', pattern),
+            )
+
+    def _get_pattern_condition(self, pattern, key_variable):
+        """Return condition which is true when ``pattern`` matches ``key_variable``."""
+        kind, text = _classify_pattern(pattern)
+        if kind == 'exact':
+            return '{} == {!r}'.format(key_variable, text)
+        if kind == 'prefix':
+            return '{}.startswith({!r})'.format(key_variable, text)
+        if kind == 'suffix':
+            return '{}.endswith({!r})'.format(key_variable, text)
+        if kind == 'contains':
+            return '{!r} in {}'.format(text, key_variable)
+        self._compile_regexps[pattern] = re.compile(pattern)
+        return 'REGEX_PATTERNS["{}"].search({})'.format(pattern, key_variable)
 
     def generate_additional_properties(self):
-        """Validate additional properties."""
-        with self.l('if isinstance({variable}, dict):'):
-            self.create_variable_keys()
-            add_prop_definition = self._definition["additionalProperties"]
-            if add_prop_definition:
-                properties_keys = self._definition.get("properties", {}).keys()
-                with self.l('for {variable}_key in {variable}_keys:'):
-                    with self.l('if {variable}_key not in "{}":', properties_keys):
-                        self.l('{variable}_value = {variable}.get({variable}_key)')
-                        self.generate_func_code_block(
-                            add_prop_definition,
-                            '{}_value'.format(self._variable),
-                            '{}.{{{}_key}}'.format(self._variable_name, self._variable),
-                        )
+        """
+        Validate additional properties.
+
+        Keys not defined in ``properties`` are found by set difference with module level
+        frozenset, keys matching any of ``patternProperties`` are removed from them
+        afterwards. All of that is done only when there is any key not defined
+        in ``properties``, which is checked without creating any new object.
+
+        .. code-block:: python
+
+            {
+                'properties': {'a': {'type': 'string'}},
+                'additionalProperties': {'type': 'integer'},
+            }
+        """
+        add_prop_definition = self._definition['additionalProperties']
+        if add_prop_definition is True or add_prop_definition == {}:
+            return
+        properties = list(self._definition.get('properties', {}))
+        patterns = list(self._definition.get('patternProperties', {}))
+        with self._type_guard('dict'):
+            if properties:
+                constant_name = self.create_global_constant('PROPERTIES', 'frozenset({!r})'.format(properties))
+                condition = 'not {}.issuperset({})'.format(constant_name, self._variable)
+                keys = '{}.keys() - {}'.format(self._variable, constant_name)
             else:
-                with self.l('if {variable}_keys:'):
-                    self.l('raise JsonSchemaException("{name} must contain only specified properties")')
+                condition = self._variable
+                keys = self._variable
+            with self.l('if {}:', condition):
+                if patterns:
+                    pattern_condition = ' or '.join(
+                        self._get_pattern_condition(pattern, '{}_key'.format(self._variable))
+                        for pattern in patterns
+                    )
+                    self.l(
+                        '{variable}__additional_keys = [{variable}_key for {variable}_key in {} if not ({})]',
+                        keys,
+                        pattern_condition,
+                    )
+                    keys = '{}__additional_keys'.format(self._variable)
+                if add_prop_definition is False:
+                    if patterns:
+                        with self.l('if {}:', keys):
+                            self.exc('{name} must contain only specified properties')
+                    else:
+                        self.exc('{name} must contain only specified properties')
+                    return
+                with self.l('for {variable}_key in {}:', keys):
+                    self.l('{variable}_value = {variable}[{variable}_key]')
+                    self.generate_func_code_block(
+                        add_prop_definition,
+                        '{}_value'.format(self._variable),
+                        '{}.{{{}_key}}'.format(self._variable_name, self._variable),
+                        path='{}_key'.format(self._variable),
+                        schema_path=('additionalProperties',),
+                    )
 
     def generate_dependencies(self):
         """Validate dependencies."""
-        with self.l('if isinstance({variable}, dict):'):
-            self.create_variable_keys()
+        with self._type_guard('dict'):
             for key, values in self._definition["dependencies"].items():
-                with self.l('if "{}" in {variable}_keys:', key):
+                with self.l('if "{}" in {variable}:', key):
                     if values == [] or values is True:
                         self.l('pass')
                     elif values is False:
-                        self.l('raise JsonSchemaException("{name} with false schema")')
+                        self.exc('{name} with false schema')
                     elif isinstance(values, list):
                         for value in values:
-                            with self.l('if "{}" not in {variable}_keys:', value):
-                                self.l('raise JsonSchemaException("{name} missing dependency {} for {}")', value, key)
+                            with self.l('if "{}" not in {variable}:', value):
+                                self.exc('{name} missing dependency {} for {}', value, key)
                     else:
-                        self.generate_func_code_block(values, self._variable, self._variable_name, clear_variables=True)
+                        self.generate_func_code_block(
+                            values,
+                            self._variable,
+                            self._variable_name,
+                            clear_variables=True,
+                            schema_path=('dependencies', key),
+                        )
 
     def generate_boolean_schema(self):
         """Create validator for boolean schemas."""
         if self._definition is False:
-            self.l('raise JsonSchemaException("{name} has False boolean schema")')
+            self.exc('{name} has False boolean schema')
 
     def generate_property_names(self):
         """Create validator for propertyNames definitiion."""
         property_names = self._definition.get("propertyNames", {})
         if property_names is False:
-            self.create_variable_keys()
-            with self.l('if {variable}_keys:'):
-                self.l('raise JsonSchemaException("{name} propertyNames with boolean schema false")')
+            with self._type_guard('dict'):
+                with self.l('if {variable}:'):
+                    self.exc('{name} propertyNames with boolean schema false')
         elif property_names is True:
             pass
         else:
-            with self.l('if isinstance({variable}, dict):'):
+            with self._type_guard('dict'):
                 with self.l('if len({variable}) == 0:'):
                     self.l('pass')
                 with self.l('else:'):
                     self._generate_property_names(property_names)
 
     def _generate_property_names(self, property_names):
-        with self._resolver.in_scope(self._variable_name):
-            function_name = self._generate_function_from_scope(
-                definition=property_names,
-                postfix='_property_names'
-            )
-            self.create_variable_keys()
-            with self.l('for key in {variable}_keys:'):
-                try:
-                    # call validation function
-                    self.l('{}(key)', function_name)
-                except JsonSchemaException:
-                    self.l('raise JsonSchemaException("{name} must contain only properties with correct name")')
+        if self._mode == 'exception':
+            function_name = self._generate_function_from_definition(property_names, 'property_names')
+        else:
+            function_name = self._generate_function_from_definition(property_names, 'property_names', 'boolean')
+        with self.l('for key in {variable}:'):
+            if self._mode != 'exception':
+                with self.l('if not {}(key):', function_name):
+                    self.exc('{name} must contain only properties with correct name')
+            else:
+                # call validation function, it raises exception with its own message
+                self.l('{}(key)', function_name)
 
     def generate_contains(self):
         """Create validator for contains definitiion."""
         contains_definition = self._definition['contains']
-        with self.l('if isinstance({variable}, list):'):
+        with self._type_guard('list'):
             if contains_definition is False:
-                self.l('raise JsonSchemaException("{name} has False boolean schema")')
+                self.exc('{name} has False boolean schema')
             elif contains_definition is True:
                 with self.l('if not {variable}:'):
-                    self.l('raise JsonSchemaException("{name} contains empty array is invalid")')
+                    self.exc('{name} contains empty array is invalid')
             else:
                 with self.l('if not {variable}:'):
-                    self.l('raise JsonSchemaException("{name} contains empty array is invalid")')
+                    self.exc('{name} contains empty array is invalid')
                 self._generate_contains(contains_definition)
 
     def _generate_contains(self, contains_definition):
-        with self._resolver.in_scope(self._variable_name):
-            function_name = self._generate_function_from_scope(
-                definition=contains_definition,
-                postfix='_contains'
-            )
-            self.l('found = False')
-            with self.l('for key in {variable}:'):
-                with self.l('try:'):
-                    # call validation function
-                    self.l('{}(key)', function_name)
-                    self.l('found = True')
-                with self.l('except JsonSchemaException:'):
-                    self.l('pass')
-            with self.l('if not found:'):
-                self.l('raise JsonSchemaException("{name} must contain at least some defined thing")')
+        # boolean function, so looking for first valid item doesn't raise exception for each invalid one
+        function_name = self._generate_function_from_definition(contains_definition, 'contains', 'boolean')
+        with self.l('for {variable}_item in {variable}:'):
+            with self.l('if {}({variable}_item):', function_name):
+                self.l('break')
+        with self.l('else:'):
+            self.exc('{name} must contain at least some defined thing')
 
     def generate_const(self):
         """Create validator for const definitiion."""
-        with self.l('if {variable} != {}:', self._definition['const']):
-            self.l('raise JsonSchemaException("{name} const not valid")')
+        with self.l('if {}:', self._get_not_equal_condition([self._definition['const']], 'CONST')):
+            self.exc('{name} const not valid')
 
     def generate_if_then_else(self):
-        """Create validator for if, then, and else definitiions."""
-        with self.l('try:'):
-            self.generate_func_code_block(
-                self._definition['if'],
-                self._variable,
-                self._variable_name,
-                clear_variables=True
-            )
-        with self.l('except JsonSchemaException:'):
-            if 'else' in self._definition:
-                self.generate_func_code_block(
-                    self._definition['else'],
-                    self._variable,
-                    self._variable_name,
-                    clear_variables=True
-                )
-            else:
-                self.l('pass')
-        if 'then' in self._definition:
+        """
+        Create validator for if, then, and else definitiions.
+
+        Definition of ``if`` is compiled into boolean function, so choosing of
+        ``else`` branch doesn't need to raise and catch exception.
+        """
+        if 'then' not in self._definition and 'else' not in self._definition:
+            return
+        function_name = self._generate_function_from_definition(self._definition['if'], 'if', 'boolean')
+        with self.l('if {}({variable}):', function_name):
+            self._generate_branch_block(self._definition.get('then', True), 'then')
+        if 'else' in self._definition:
             with self.l('else:'):
-                self.generate_func_code_block(
-                    self._definition['then'],
-                    self._variable,
-                    self._variable_name,
-                    clear_variables=True
-                )
+                self._generate_branch_block(self._definition['else'], 'else')
+
+    def _generate_branch_block(self, definition, keyword):
+        """Generate code block of ``definition`` for current variable which is never empty."""
+        code_length = len(self._code)
+        self.generate_func_code_block(
+            definition,
+            self._variable,
+            self._variable_name,
+            clear_variables=True,
+            schema_path=(keyword,),
+        )
+        if len(self._code) == code_length:
+            self.l('pass')
 
     def generate_content_media_type(self):
         """Check ContentMediaType."""
@@ -805,13 +1691,13 @@ class CodeGenerator(object):
                 with self.l('try:'):
                     self.l('{variable} = {variable}.decode("utf-8")')
                 with self.l('except Exception:'):
-                    self.l('raise JsonSchemaException("{name} invalid encoding")')
+                    self.exc('{name} invalid encoding')
             with self.l('if isinstance({variable}, str):'):
                 with self.l('try:'):
                     self.l('import json')
                     self.l('{variable} = json.loads({variable})')
                 with self.l('except Exception:'):
-                    self.l('raise JsonSchemaException("{name} invalid json content")')
+                    self.exc('{name} invalid json content')
 
     def generate_content_encoding(self):
         """Check contentEncoding, and decodes it if 'base64'."""
@@ -821,9 +1707,77 @@ class CodeGenerator(object):
                     self.l('import base64')
                     self.l('{variable} = base64.b64decode({variable})')
                 with self.l('except Exception:'):
-                    self.l('raise JsonSchemaException("{name} invalid content encoding")')
+                    self.exc('{name} invalid content encoding')
                 with self.l('if {variable} == "":'):
-                    self.l('raise JsonSchemaException("{name} invalid content encoding")')
+                    self.exc('{name} invalid content encoding')
         if 'contentMediaType' in self._definition:
             # run now because skipped in generate_content_media_type
             self._generate_content_media_type()
+
+
+# backreferences and global flags which can't be used inside of combined pattern
+_UNCOMBINABLE_PATTERN_REGEX = re.compile(r'\\[1-9]|\(\?P=|^\(\?[aiLmsux]+\)')
+_REGEX_SPECIAL_CHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def _classify_pattern(pattern):
+    """
+    Return kind of regular expression ``pattern`` and its text when it matches only text.
+
+    Kind is ``exact`` for ``^text$``, ``prefix`` for ``^text``, ``suffix`` for ``text$``,
+    ``contains`` for ``text`` and ``regex`` for anything else (text is ``None`` then).
+    """
+    start = pattern.startswith('^')
+    body = pattern[1:] if start else pattern
+    # dollar is anchor only when it's not escaped by odd number of backslashes
+    end = body.endswith('$') and (len(body) - len(body[:-1].rstrip('\\'))) % 2 == 1
+    if end:
+        body = body[:-1]
+    text = []
+    escaped = False
+    for char in body:
+        if escaped:
+            if char.isalnum() or ord(char) >= 128:
+                # character class like \d or unicode escape
+                return 'regex', None
+            text.append(char)
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif char in _REGEX_SPECIAL_CHARACTERS:
+            return 'regex', None
+        else:
+            text.append(char)
+    if escaped:
+        return 'regex', None
+    text = ''.join(text)
+    if start and end:
+        return 'exact', text
+    if start:
+        return 'prefix', text
+    if end:
+        return 'suffix', text
+    return 'contains', text
+
+
+# keywords with subdefinition or list of them applied to validated data or its items
+_SUBDEFINITION_KEYWORDS = (
+    'items', 'additionalItems', 'contains', 'additionalProperties', 'propertyNames',
+    'allOf', 'anyOf', 'oneOf', 'not', 'if', 'then', 'else',
+)
+# keywords with mapping of subdefinitions applied to values of properties
+_SUBDEFINITION_MAPPING_KEYWORDS = ('properties', 'patternProperties', 'dependencies')
+
+
+def _get_definition_size(definition):
+    """Return number of keywords of ``definition`` including ones of all its subdefinitions."""
+    if isinstance(definition, dict):
+        return sum(1 + _get_definition_size(value) for value in definition.values())
+    if isinstance(definition, list):
+        return sum(_get_definition_size(item) for item in definition)
+    return 0
+
+
+def _escape_pointer(key):
+    """Escape ``key`` to be used in JSON pointer."""
+    return str(key).replace('~', '~0').replace('/', '~1')
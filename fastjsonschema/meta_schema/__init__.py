@@ -647,31 +647,20 @@ URI_TO_ID_TYPE = {
 
 URI_TO_FORMAT_REGEXS = {
     'http://json-schema.org/draft-04/schema#': {
-        'date-time': FORMAT_REGEXS['date-time'],
         'email': FORMAT_REGEXS['email'],
         'hostname': FORMAT_REGEXS['hostname'],
-        'ipv4': FORMAT_REGEXS['ipv4'],
-        'ipv6': FORMAT_REGEXS['ipv6'],
         'uri': FORMAT_REGEXS['uri'],
     },
     'http://json-schema.org/draft-06/schema#': {
-        'date-time': FORMAT_REGEXS['date-time'],
         'email': FORMAT_REGEXS['email'],
         'hostname': FORMAT_REGEXS['hostname'],
-        'ipv4': FORMAT_REGEXS['ipv4'],
-        'ipv6': FORMAT_REGEXS['ipv6'],
         'uri': FORMAT_REGEXS['uri'],
         'uri-template': FORMAT_REGEXS['uri-template'],
     },
     'http://json-schema.org/draft-07/schema#': {
-        'date': FORMAT_REGEXS['date'],
-        'date-time': FORMAT_REGEXS['date-time'],
         'email': FORMAT_REGEXS['email'],
         'hostname': FORMAT_REGEXS['hostname'],
-        'ipv4': FORMAT_REGEXS['ipv4'],
-        'ipv6': FORMAT_REGEXS['ipv6'],
         'relative-json-pointer': FORMAT_REGEXS['relative-json-pointer'],
-        'time': FORMAT_REGEXS['time'],
         'uri': FORMAT_REGEXS['uri'],
         'uri-template': FORMAT_REGEXS['uri-template'],
     },
@@ -679,20 +668,31 @@ URI_TO_FORMAT_REGEXS = {
 
 URI_TO_FORMAT_FUNCTIONS = {
     'http://json-schema.org/draft-04/schema#': {
+        'date-time': FORMAT_FUNCTIONS['date-time'],
+        'ipv4': FORMAT_FUNCTIONS['ipv4'],
+        'ipv6': FORMAT_FUNCTIONS['ipv6'],
         'regex': FORMAT_FUNCTIONS['regex'],
     },
     'http://json-schema.org/draft-06/schema#': {
+        'date-time': FORMAT_FUNCTIONS['date-time'],
+        'ipv4': FORMAT_FUNCTIONS['ipv4'],
+        'ipv6': FORMAT_FUNCTIONS['ipv6'],
         'json-pointer': FORMAT_FUNCTIONS['json-pointer'],
         'regex': FORMAT_FUNCTIONS['regex'],
         'uri-reference': FORMAT_FUNCTIONS['uri-reference'],
     },
     'http://json-schema.org/draft-07/schema#': {
+        'date': FORMAT_FUNCTIONS['date'],
+        'date-time': FORMAT_FUNCTIONS['date-time'],
         'idn-email': FORMAT_FUNCTIONS['idn-email'],
         'idn-hostname': FORMAT_FUNCTIONS['idn-hostname'],
+        'ipv4': FORMAT_FUNCTIONS['ipv4'],
+        'ipv6': FORMAT_FUNCTIONS['ipv6'],
         'iri': FORMAT_FUNCTIONS['iri'],
         'iri-reference': FORMAT_FUNCTIONS['iri-reference'],
         'json-pointer': FORMAT_FUNCTIONS['json-pointer'],
         'regex': FORMAT_FUNCTIONS['regex'],
+        'time': FORMAT_FUNCTIONS['time'],
         'uri-reference': FORMAT_FUNCTIONS['uri-reference'],
     },
 }
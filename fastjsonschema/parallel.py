@@ -0,0 +1,118 @@
+"""
+Module for validation of many documents in more processes.
+
+Validation is pure Python code, so one process can use only one CPU core.
+:any:`ParallelValidator` generates code only once and sends it to worker
+processes together with chunks of documents. Each worker executes the code
+only with its first chunk and reuses the validation function for the rest.
+
+.. code-block:: python
+
+    from fastjsonschema.parallel import ParallelValidator
+
+    with ParallelValidator({'type': 'string'}, workers=4) as validator:
+        for index, exception in validator.validate(documents):
+            print(index, exception.message)
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+from itertools import islice
+import os
+
+from .config import Config
+
+
+# generated code and its validation function in worker process created by `_get_worker_validator`,
+# executor initializer is not used, because it's available only since Python 3.7
+_WORKER_CODE = None
+_WORKER_VALIDATE_BATCH = None
+
+
+def _get_worker_validator(name, code):
+    """Return batch function of generated ``code``, it's executed only once in worker process."""
+    # pylint: disable=global-statement,exec-used
+    global _WORKER_CODE, _WORKER_VALIDATE_BATCH
+    if code != _WORKER_CODE:
+        state = {}
+        exec(code, state)
+        _WORKER_CODE, _WORKER_VALIDATE_BATCH = code, state[name]
+    return _WORKER_VALIDATE_BATCH
+
+
+def _validate_chunk(chunk):
+    """Validate chunk of documents in worker process, indexes are shifted by offset of chunk."""
+    name, code, offset, documents = chunk
+    failures = _get_worker_validator(name, code)(documents)
+    if failures and isinstance(failures[0], int):
+        # boolean mode returns only indexes
+        return [offset + index for index in failures]
+    return [(offset + index, error) for index, error in failures]
+
+
+class ParallelValidator(object):
+    """
+    Validator of many documents in pool of processes.
+
+    Results are same as of function compiled with ``Config(batch=True)``,
+    only failures in order of input documents. Documents are read from iterable
+    only when there is place for next chunk, at most two chunks per worker are
+    waiting for result, so iterable can be also big generator.
+
+    Documents are validated by copies in worker processes, so values of ``default``
+    keywords are not filled in the documents of the caller.
+
+    :argument dict definition: Json schema definition
+    :argument Config config: Config object, ``batch`` option is always used
+    :argument int workers: number of processes, number of CPUs by default
+    :argument int chunk_size: number of documents sent to process at once
+    """
+
+    def __init__(self, definition, config=None, workers=None, chunk_size=1000):
+        """Init."""
+        # imported here because of circular import
+        from . import compile_to_code
+        config = copy(config) if config else Config()
+        config.batch = True
+        self.chunk_size = chunk_size
+        self._max_pending = 2 * (workers or os.cpu_count() or 1)
+        self._name, self._code = compile_to_code(definition, config)
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+
+    def __enter__(self):
+        """Return validator to be used in ``with`` statement."""
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        """Shut down worker processes."""
+        self.close()
+
+    def validate(self, documents):
+        """
+        Validate iterable of documents.
+
+        :rtype: list: failures, see :any:`CodeGenerator.generate_batch_function`
+        """
+        failures = []
+        pending = deque()
+        for chunk in self._chunks(documents):
+            if len(pending) >= self._max_pending:
+                failures.extend(pending.popleft().result())
+            pending.append(self._executor.submit(_validate_chunk, chunk))
+        while pending:
+            failures.extend(pending.popleft().result())
+        return failures
+
+    def close(self):
+        """Shut down worker processes."""
+        self._executor.shutdown()
+
+    def _chunks(self, documents):
+        iterator = iter(documents)
+        offset = 0
+        chunk = list(islice(iterator, self.chunk_size))
+        while chunk:
+            yield self._name, self._code, offset, chunk
+            offset += len(chunk)
+            chunk = list(islice(iterator, self.chunk_size))
@@ -0,0 +1,57 @@
+"""
+Module for profile guided order of ``anyOf`` and ``oneOf`` definitions.
+
+Validation function compiled with ``Config(profile_branches=True)`` counts
+how many times each definition of ``anyOf`` and ``oneOf`` was valid. Counts
+are keyed by JSON pointers of keywords in the schema, so they can be used
+also for changed schema as far as pointers and numbers of definitions stay
+same. Function compiled with ``Config(branch_profile=...)`` tries definitions
+which were valid most often first.
+
+.. code-block:: python
+
+    import fastjsonschema
+    from fastjsonschema.profile import save_branch_profile, load_branch_profile
+
+    validate = fastjsonschema.compile(definition, Config(profile_branches=True))
+    for document in sample:
+        validate(document)
+    save_branch_profile(validate, 'profile.json')
+
+    validate = fastjsonschema.compile(definition, Config(branch_profile=load_branch_profile('profile.json')))
+"""
+
+import json
+
+
+def get_branch_profile(validator):
+    """
+    Return counts of valid definitions collected by ``validator``.
+
+    :argument validator: function compiled with ``Config(profile_branches=True)``
+    :rtype: dict: lists of counts of definitions keyed by JSON pointers of keywords
+    """
+    profile = validator.__globals__.get('BRANCH_PROFILE', {})
+    return {pointer: list(counts) for pointer, counts in profile.items()}
+
+
+def save_branch_profile(validator, path):
+    """
+    Save counts of valid definitions collected by ``validator`` as JSON file.
+
+    :argument validator: function compiled with ``Config(profile_branches=True)``
+    :argument str path: path of profile file
+    """
+    with open(path, 'w') as file_handle:
+        json.dump(get_branch_profile(validator), file_handle, indent=2, sort_keys=True)
+
+
+def load_branch_profile(path):
+    """
+    Load profile saved by :any:`save_branch_profile`.
+
+    :argument str path: path of profile file
+    :rtype: dict: to be used as ``Config(branch_profile=...)``
+    """
+    with open(path) as file_handle:
+        return json.load(file_handle)
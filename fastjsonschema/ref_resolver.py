@@ -150,6 +150,28 @@ class RefResolver(object):
         finally:
             self.resolution_scope = old_scope
 
+    def get_state(self):
+        """
+        Get current state of resolving.
+
+        :rtype: tuple: base URI, schema and resolution scope.
+        """
+        return self.base_uri, self.schema, self.resolution_scope
+
+    @contextlib.contextmanager
+    def in_state(self, state: tuple):
+        """
+        Context manager to resolve in state returned by :any:`get_state`.
+
+        :argument tuple state: state to restore
+        """
+        old_state = self.get_state()
+        self.base_uri, self.schema, self.resolution_scope = state
+        try:
+            yield
+        finally:
+            self.base_uri, self.schema, self.resolution_scope = old_state
+
     @contextlib.contextmanager
     def resolving(self, ref: str):
         """
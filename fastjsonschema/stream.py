@@ -0,0 +1,111 @@
+"""
+Module for validation of JSON Lines.
+
+Every line of input is one JSON document validated by compiled validation
+function. Input is read in big chunks, so only one chunk is kept in memory
+no matter how big the input is.
+
+.. code-block:: python
+
+    import fastjsonschema
+    from fastjsonschema.stream import validate_lines
+
+    validate = fastjsonschema.compile({'type': 'object'})
+    for line_no, ok, error in validate_lines(validate, 'data.jsonl'):
+        if not ok:
+            print(line_no, error.message)
+"""
+
+import json
+import mmap
+import os
+from pathlib import PurePath
+
+from .exceptions import JsonSchemaException
+
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+JSON_LINES_EXTENSIONS = ('.jsonl', '.ndjson')
+
+
+def validate_lines(validator, source, chunk_size=DEFAULT_CHUNK_SIZE, use_mmap=False):
+    """
+    Validate every line of ``source`` by ``validator``.
+
+    Empty lines are skipped. Lines which are not valid JSON are reported
+    as failed with :any:`JsonSchemaException`.
+
+    :argument validator: validation function generated in ``exception`` mode
+    :argument source: path or binary file object with JSON Lines
+    :argument int chunk_size: number of bytes read at once
+    :argument bool use_mmap: whether file should be memory mapped instead of read
+        in chunks, it needs real file on disk
+    :returns: generator of tuples ``(line_no, ok, error)``, where ``line_no``
+        starts with 1 and ``error`` is ``None`` for valid lines
+    """
+    if isinstance(source, PurePath):
+        # pathlib paths have no __fspath__ and can't be opened before Python 3.6
+        source = str(source)
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        with open(source, 'rb') as file_handle:
+            yield from validate_lines(validator, file_handle, chunk_size, use_mmap)
+        return
+    lines = _iter_mmap_lines(source) if use_mmap else _iter_lines(source, chunk_size)
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            # json.loads accepts bytes only since Python 3.6, UnicodeDecodeError is ValueError too
+            document = json.loads(line.decode('utf-8'))
+        except ValueError as exception:
+            yield line_no, False, JsonSchemaException('line {} is not valid JSON: {}'.format(line_no, exception))
+            continue
+        try:
+            validator(document)
+        except JsonSchemaException as exception:
+            yield line_no, False, exception
+        else:
+            yield line_no, True, None
+
+
+def is_json_lines(filename):
+    """Return True if ``filename`` has extension of JSON Lines."""
+    return filename.lower().endswith(JSON_LINES_EXTENSIONS)
+
+
+def _iter_lines(file_handle, chunk_size):
+    """Yield lines of ``file_handle`` without newlines reading it by ``chunk_size`` bytes."""
+    # pieces of unfinished line, joined only once its end is read
+    rest = []
+    while True:
+        chunk = file_handle.read(chunk_size)
+        if not chunk:
+            break
+        end = chunk.find(b'\n')
+        if end == -1:
+            rest.append(chunk)
+            continue
+        rest.append(chunk[:end])
+        yield b''.join(rest)
+        lines = chunk[end + 1:].split(b'\n')
+        rest = [lines.pop()]
+        yield from lines
+    if any(rest):
+        yield b''.join(rest)
+
+
+def _iter_mmap_lines(file_handle):
+    """Yield lines of ``file_handle`` without newlines using memory mapped file."""
+    if not os.fstat(file_handle.fileno()).st_size:
+        # empty file can't be mapped
+        return
+    with mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start = 0
+        end = mapped.find(b'\n')
+        while end != -1:
+            yield mapped[start:end]
+            start = end + 1
+            end = mapped.find(b'\n', start)
+        if start < len(mapped):
+            yield mapped[start:]
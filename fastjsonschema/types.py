@@ -43,5 +43,5 @@ class TypeResolver(object):
         if ('number' in types or 'integer' in types) and 'boolean' not in types:
             extra += ' or isinstance({variable}, bool)'
         if_statement = 'if not isinstance({{variable}}, ({})){}:'.format(python_types, extra)
-        raise_statement = 'raise JsonSchemaException("{{name}} must be {}")'.format(' or '.join(types))
-        return if_statement, raise_statement
+        message = '{{name}} must be {}'.format(' or '.join(types))
+        return if_statement, message
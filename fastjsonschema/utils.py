@@ -70,3 +70,66 @@ def get_valid_function_name(input_string: str) -> str:
     """
     result = '_'.join([word for word in split_words(input_string)])
     return re.sub('_(?=[0-9])', '', result)
+
+
+# types which are same by JSON schema as by Python equality
+_UNIQUE_KEY_SCALARS = frozenset((str, int, float, type(None)))
+
+
+def unique_key(value):
+    """
+    Return hashable key of JSON value used for checking uniqueness of items.
+
+    Two values have same key only when they are equal by JSON schema. Therefore
+    numbers ``1`` and ``1.0`` have same key, but ``True`` has different one.
+
+    :param value: JSON value.
+    :returns: Hashable key.
+    """
+    value_type = type(value)
+    if value_type in _UNIQUE_KEY_SCALARS:
+        return value
+    if value_type is bool:
+        return (bool, value)
+    if value_type is list:
+        return (list, tuple([
+            item if type(item) in _UNIQUE_KEY_SCALARS else unique_key(item)
+            for item in value
+        ]))
+    if value_type is dict:
+        return (dict, tuple(sorted([
+            (key, item if type(item) in _UNIQUE_KEY_SCALARS else unique_key(item))
+            for key, item in value.items()
+        ])))
+    if isinstance(value, dict):
+        return unique_key(dict(value))
+    if isinstance(value, (list, tuple)):
+        return unique_key(list(value))
+    return value
+
+
+def has_duplicates(items):
+    """
+    Check if any value in list is in it more than once.
+
+    Python set is tried first, values equal in Python are superset of values
+    equal by JSON schema (``True == 1`` in Python), so when set has no duplicates,
+    there is none. Otherwise values are checked by :any:`unique_key` one by one
+    and it stops on first found duplicate.
+
+    :param list items: List of JSON values.
+    :returns: True if there is any duplicate.
+    """
+    try:
+        if len(set(items)) == len(items):
+            return False
+    except TypeError:
+        # unhashable lists or dictionaries
+        pass
+    seen = set()
+    for item in items:
+        key = unique_key(item)
+        if key in seen:
+            return True
+        seen.add(key)
+    return False
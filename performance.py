@@ -1,4 +1,7 @@
 from textwrap import dedent
+import json
+import os
+import sys
 import timeit
 
 # apt-get install jsonschema json-spec validictory
@@ -6,6 +9,7 @@ import fastjsonschema
 import jsonschema
 import validictory
 from jsonspec.validators import load
+from fastjsonschema.parallel import ParallelValidator
 
 
 NUMBER = 1000
@@ -80,8 +84,28 @@ config = fastjsonschema.Config(meta_schema='draft4')
 fastjsonschema_validate = fastjsonschema.compile(JSON_SCHEMA, config=config)
 fast_compiled = lambda value, _: fastjsonschema_validate(value)
 
+fastjsonschema_is_valid = fastjsonschema.compile(
+    JSON_SCHEMA, config=fastjsonschema.Config(meta_schema='draft4', mode='boolean'))
+fast_boolean = lambda value, _: fastjsonschema_is_valid(value)
+
+fastjsonschema_validate_batch = fastjsonschema.compile(
+    JSON_SCHEMA, config=fastjsonschema.Config(meta_schema='draft4', batch=True))
+fast_batch = lambda values, _: fastjsonschema_validate_batch(values)
+
+def fast_loop(values, _):
+    failures = []
+    for index, value in enumerate(values):
+        try:
+            fastjsonschema_validate(value)
+        except fastjsonschema.JsonSchemaException as error:
+            failures.append((index, error))
+    return failures
+
 fast_not_compiled = lambda value, json_schema: fastjsonschema.compile(json_schema, config=config)(value)
 
+config_not_cached = fastjsonschema.Config(meta_schema='draft4', cache_validators=False)
+fast_not_cached = lambda value, json_schema: fastjsonschema.compile(json_schema, config=config_not_cached)(value)
+
 name, code = fastjsonschema.compile_to_code(JSON_SCHEMA, config=config)
 with open('temp/performance.py', 'w') as f:
     f.write(code)
@@ -92,7 +116,7 @@ jsonspec = load(JSON_SCHEMA)
 jsonschema_validator = jsonschema.Draft4Validator(JSON_SCHEMA)
 jsonschema_compiled = lambda value, _: jsonschema_validator.validate(value)
 
-def t(func, valid_values=True):
+def t(func, valid_values=True, batch=False):
     module = func.split('.')[0]
 
     setup = """from __main__ import (
@@ -104,13 +128,21 @@ def t(func, valid_values=True):
         jsonschema,
         jsonspec,
         fast_compiled,
+        fast_boolean,
         fast_file,
         fast_not_compiled,
+        fast_not_cached,
         fast_file_not_comp,
+        fast_batch,
+        fast_loop,
     )
     """
 
-    if valid_values:
+    if batch:
+        code = dedent("""
+        {}(VALUES_OK if {} else VALUES_BAD, JSON_SCHEMA)
+        """.format(func, valid_values))
+    elif valid_values:
         code = dedent("""
         for value in VALUES_OK:
             {}(value, JSON_SCHEMA)
@@ -128,14 +160,72 @@ def t(func, valid_values=True):
     print('{:<25} {:<10} ==> {}'.format(module, 'valid' if valid_values else 'invalid', res))
 
 
+def t_parallel(workers, number=100000):
+    documents = [json.loads(json.dumps(VALUES_OK[index % len(VALUES_OK)])) for index in range(number)]
+    with ParallelValidator(JSON_SCHEMA, config=config, workers=workers, chunk_size=2000) as validator:
+        # start all worker processes before measuring
+        validator.validate(documents[:workers * 2000])
+        start = timeit.default_timer()
+        validator.validate(documents)
+        res = timeit.default_timer() - start
+    print('{:<25} {:<10} ==> {:.0f} documents/s'.format('fast_parallel', '{} workers'.format(workers), number / res))
+
+
+def t_opcodes(validator, valid_values=True):
+    """
+    Print number of bytecode instructions executed by validation of all values.
+
+    Tracing of opcodes needs Python 3.7, older versions count executed lines.
+    """
+    count = 0
+    trace_opcodes = sys.version_info >= (3, 7)
+    counted_event = 'opcode' if trace_opcodes else 'line'
+
+    def trace(frame, event, _):
+        nonlocal count
+        if trace_opcodes:
+            frame.f_trace_opcodes = True
+        if event == counted_event:
+            count += 1
+        return trace
+
+    sys.settrace(trace)
+    try:
+        for value in VALUES_OK if valid_values else VALUES_BAD:
+            try:
+                validator(value)
+            except fastjsonschema.JsonSchemaException:
+                pass
+    finally:
+        sys.settrace(None)
+    print('{:<25} {:<10} ==> {} {}s'.format(
+        'fast_opcodes', 'valid' if valid_values else 'invalid', count, counted_event,
+    ))
+
+
 print('Number: {}'.format(NUMBER))
 
+t_opcodes(fastjsonschema_validate)
+t_opcodes(fastjsonschema_validate, valid_values=False)
+
 t('fast_compiled')
 t('fast_compiled', valid_values=False)
 
+t('fast_boolean')
+t('fast_boolean', valid_values=False)
+
 t('fast_file')
 t('fast_file', valid_values=False)
 
+t('fast_loop', batch=True)
+t('fast_loop', valid_values=False, batch=True)
+
+t('fast_batch', batch=True)
+t('fast_batch', valid_values=False, batch=True)
+
+for workers in sorted({1, 2, 4, os.cpu_count()}):
+    t_parallel(workers)
+
 t('jsonschema_compiled')
 t('jsonschema_compiled', valid_values=False)
 
@@ -145,6 +235,9 @@ t('fast_file_not_comp', valid_values=False)
 t('fast_not_compiled')
 t('fast_not_compiled', valid_values=False)
 
+t('fast_not_cached')
+t('fast_not_cached', valid_values=False)
+
 t('jsonschema.validate')
 t('jsonschema.validate', valid_values=False)
 
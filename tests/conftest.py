@@ -2,6 +2,7 @@
 import os
 import sys
 import importlib
+from copy import deepcopy
 from pprint import pprint
 
 import requests
@@ -44,16 +45,49 @@ CONFIG = Config(
     validate_schema=False,
 )
 
+CONFIG_BOOLEAN = Config(
+    meta_schema='draft4',
+    uri_handlers={'http': remotes_handler},
+    validate_schema=False,
+    mode='boolean',
+)
+
+CONFIG_ERRORS = Config(
+    meta_schema='draft4',
+    uri_handlers={'http': remotes_handler},
+    validate_schema=False,
+    mode='errors',
+)
+
 
 @pytest.fixture
 def asserter():
-    def f(definition, value, expected):
-        config = Config(meta_schema='draft4')
+    def f(definition, value, expected, **options):
+        """
+        Check ``value`` in all modes. Draft 4 is used by default, other
+        ``options`` (like ``meta_schema='draft7'``) are passed to :any:`Config`.
+        """
+        if options:
+            options = dict({'meta_schema': 'draft4', 'uri_handlers': {'http': remotes_handler}}, **options)
+            config, config_boolean, config_errors = (
+                Config(mode=mode, **options) for mode in ('exception', 'boolean', 'errors')
+            )
+        else:
+            config, config_boolean, config_errors = CONFIG, CONFIG_BOOLEAN, CONFIG_ERRORS
         # When test fails, it will show up code.
-        resolver, code_generator = _factory(definition, config=CONFIG)
+        resolver, code_generator = _factory(definition, config=config)
         print(code_generator.code)
 
-        validator = compile(definition, config=CONFIG)
+        is_valid = compile(definition, config=config_boolean)
+        assert is_valid(deepcopy(value)) is not isinstance(expected, JsonSchemaException)
+
+        errors = compile(definition, config=config_errors)(deepcopy(value))
+        if isinstance(expected, JsonSchemaException):
+            assert errors[0].message == expected.message
+        else:
+            assert errors == []
+
+        validator = compile(definition, config=config)
         if isinstance(expected, JsonSchemaException):
             with pytest.raises(JsonSchemaException) as exc:
                 validator(value)
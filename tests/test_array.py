@@ -1,7 +1,7 @@
 
 import pytest
 
-from fastjsonschema import JsonSchemaException
+from fastjsonschema import JsonSchemaException, compile
 
 
 exc = JsonSchemaException('data must be array')
@@ -60,6 +60,57 @@ def test_unique_items(asserter, value, expected):
     }, value, expected)
 
 
+exc = JsonSchemaException('data must contain unique items')
+@pytest.mark.parametrize('value, expected', [
+    ([1, True], [1, True]),
+    ([0, False], [0, False]),
+    ([1, '1'], [1, '1']),
+    ([1, 1.0], exc),
+    ([None, None], exc),
+    ([[1], [True]], [[1], [True]]),
+    ([[1], [1.0]], exc),
+    ([{'a': 1, 'b': [2]}, {'b': [2], 'a': 1}], exc),
+    ([{'a': 1}, {'a': True}], [{'a': 1}, {'a': True}]),
+    ([{'a': 1}, [['a', 1]]], [{'a': 1}, [['a', 1]]]),
+])
+def test_unique_items_json_equality(asserter, value, expected):
+    asserter({'uniqueItems': True}, value, expected)
+
+
+@pytest.mark.parametrize('items_type, value, expected', [
+    ('string', ['a', 'b'], ['a', 'b']),
+    ('string', ['a', 'a'], JsonSchemaException('data must contain unique items')),
+    ('string', [[], []], JsonSchemaException('data[0] must be string')),
+    ('number', [1, 1.0], JsonSchemaException('data must contain unique items')),
+    ('number', [1, True], JsonSchemaException('data[1] must be number')),
+])
+def test_unique_items_of_type(asserter, items_type, value, expected):
+    asserter({
+        'uniqueItems': True,
+        'items': {'type': items_type},
+    }, value, expected)
+
+
+def test_unique_items_false(asserter):
+    asserter({'uniqueItems': False}, [1, 1], [1, 1])
+
+
+@pytest.mark.benchmark(
+    min_time=0.01,
+    max_time=2,
+    min_rounds=20,
+    warmup=False
+)
+@pytest.mark.parametrize('items', [
+    list(range(10000)),
+    [str(index) for index in range(10000)],
+    [{'a': index, 'b': [index]} for index in range(10000)],
+], ids=['numbers', 'strings', 'objects'])
+def test_bench_unique_items(benchmark, items):
+    validate = compile({'uniqueItems': True})
+    benchmark(validate, items)
+
+
 @pytest.mark.parametrize('value, expected', [
     ([], []),
     ([1], [1]),
@@ -126,3 +177,37 @@ def test_different_items_without_additional_items(asserter, value, expected):
         ],
         'additionalItems': False,
     }, value, expected)
+
+
+exc = JsonSchemaException('data must contain at least some defined thing')
+@pytest.mark.parametrize('value, expected', [
+    ([1, 'a', 2], [1, 'a', 2]),
+    (['a', 'b', 3], ['a', 'b', 3]),
+    (['a', 'b'], exc),
+    ([[1]], exc),
+])
+def test_contains(asserter, value, expected):
+    asserter({'contains': {'type': 'integer'}}, value, expected, meta_schema='draft7')
+
+
+@pytest.mark.parametrize('value, expected', [
+    ([[0], [2, 1]], [[0], [2, 1]]),
+    ([[0], [2]], exc),
+])
+def test_contains_nested(asserter, value, expected):
+    asserter({'contains': {'contains': {'const': 1}}}, value, expected, meta_schema='draft7')
+
+
+@pytest.mark.benchmark(
+    min_time=0.01,
+    max_time=2,
+    min_rounds=20,
+    warmup=False
+)
+@pytest.mark.parametrize('items', [
+    [1] + ['a'] * 10000,
+    ['a'] * 10000 + [1],
+], ids=['front', 'back'])
+def test_bench_contains(benchmark, items):
+    validate = compile({'contains': {'type': 'integer'}})
+    benchmark(validate, items)
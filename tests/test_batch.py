@@ -0,0 +1,59 @@
+import pytest
+
+from fastjsonschema import Config, JsonSchemaException, compile, compile_to_code
+
+
+DEFINITION = {
+    'type': 'object',
+    'properties': {
+        'a': {'type': 'integer', 'default': 1},
+        'b': {'$ref': '#/definitions/b'},
+    },
+    'definitions': {
+        'b': {'type': 'string'},
+    },
+}
+ITEMS = [{'a': 1}, {'a': 'x'}, {}, {'b': 2}, 42]
+
+
+def test_batch_exception_mode():
+    validate_batch = compile(DEFINITION, Config(batch=True))
+    items = [dict(item) if isinstance(item, dict) else item for item in ITEMS]
+    failures = validate_batch(items)
+    assert [index for index, _ in failures] == [1, 3, 4]
+    assert all(isinstance(error, JsonSchemaException) for _, error in failures)
+    assert [error.message for _, error in failures] == [
+        'data.a must be integer',
+        'data must be string',
+        'data must be object',
+    ]
+    # defaults are set directly in validated documents
+    assert items[2] == {'a': 1}
+
+
+def test_batch_boolean_mode():
+    validate_batch = compile(DEFINITION, Config(batch=True, mode='boolean'))
+    assert validate_batch(ITEMS) == [1, 3, 4]
+
+
+def test_batch_errors_mode():
+    validate_batch = compile(DEFINITION, Config(batch=True, mode='errors'))
+    failures = validate_batch(ITEMS)
+    assert [(index, [error.pointer for error in errors]) for index, errors in failures] == [
+        (1, ['/a']),
+        (3, ['/b']),
+        (4, ['']),
+    ]
+
+
+@pytest.mark.parametrize('definition', [True, {}, {'type': 'string'}])
+def test_batch_accepts_any_iterable(definition):
+    validate_batch = compile(definition, Config(batch=True))
+    assert validate_batch(iter(['a', 'b'])) == []
+
+
+def test_batch_inlines_rules_in_loop():
+    name, code = compile_to_code({'type': 'string'}, Config(batch=True))
+    assert name == 'validate_batch'
+    batch_code = code[code.index('def validate_batch'):code.index('def validate(')]
+    assert 'validate(' not in batch_code
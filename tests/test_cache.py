@@ -0,0 +1,88 @@
+import pytest
+
+import fastjsonschema
+from fastjsonschema import Config, JsonSchemaException, compile, validator_cache
+from fastjsonschema.cache import ValidatorCache, schema_hash
+
+
+def test_schema_hash_is_canonical():
+    assert schema_hash({'type': 'string', 'maxLength': 5}) == schema_hash({'maxLength': 5, 'type': 'string'})
+    assert schema_hash({'const': 1}) != schema_hash({'const': True})
+    assert schema_hash({'const': 1}) != schema_hash({'const': 1.0})
+
+
+def test_compile_returns_cached_validator():
+    validator_cache.clear()
+    validate = compile({'type': 'string', 'maxLength': 3})
+    assert compile({'maxLength': 3, 'type': 'string'}) is validate
+    assert validator_cache.info()[:2] == (1, 1)
+    assert validate('abc') == 'abc'
+    with pytest.raises(JsonSchemaException):
+        validate('abcd')
+
+
+def test_compile_cache_respects_config():
+    validator_cache.clear()
+    validate_draft4 = compile({'type': 'integer'}, Config(meta_schema='draft4'))
+    validate_draft7 = compile({'type': 'integer'}, Config(meta_schema='draft7'))
+    assert validate_draft4 is not validate_draft7
+    assert validate_draft7(1.0) == 1.0
+    with pytest.raises(JsonSchemaException):
+        validate_draft4(1.0)
+    assert len(validator_cache) == 2
+
+
+def test_compile_cache_disabled():
+    validator_cache.clear()
+    config = Config(cache_validators=False)
+    assert compile({'type': 'string'}, config) is not compile({'type': 'string'}, config)
+    assert len(validator_cache) == 0
+
+
+def test_cache_eviction():
+    cache = ValidatorCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.info() == (3, 1, 1, 2, 2)
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+
+def test_bytecode_cache(tmpdir, monkeypatch):
+    config = Config(cache_validators=False, cache_dir=str(tmpdir))
+    definition = {'type': 'object', 'properties': {'a': {'type': 'string', 'pattern': '^[ab]+$'}}}
+    validate = compile(definition, config)
+    assert len(tmpdir.listdir()) == 1
+    assert sorted(path.ext for path in tmpdir.listdir()[0].listdir()) == ['.bin', '.py']
+
+    def factory(*args, **kwds):
+        raise AssertionError('Code should not be generated')
+    monkeypatch.setattr(fastjsonschema, '_factory', factory)
+    cached_validate = compile(definition, config)
+    assert cached_validate is not validate
+    assert cached_validate({'a': 'ab'}) == {'a': 'ab'}
+    with pytest.raises(JsonSchemaException):
+        cached_validate({'a': 'c'})
+
+
+def test_bytecode_cache_invalidated_by_version(tmpdir, monkeypatch):
+    config = Config(cache_validators=False, cache_dir=str(tmpdir))
+    compile({'type': 'string'}, config)
+    monkeypatch.setattr(fastjsonschema.cache, '__version__', 'next')
+    assert compile({'type': 'string'}, config)('a') == 'a'
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_bytecode_cache_ignores_corrupted_file(tmpdir):
+    config = Config(cache_validators=False, cache_dir=str(tmpdir))
+    compile({'type': 'string'}, config)
+    for path in tmpdir.listdir()[0].listdir():
+        path.write_binary(b'corrupted')
+    validate = compile({'type': 'string'}, config)
+    with pytest.raises(JsonSchemaException):
+        validate(1)
@@ -1,7 +1,7 @@
 
 import pytest
 
-from fastjsonschema import JsonSchemaException
+from fastjsonschema import Config, JsonSchemaException, compile
 
 
 exc = JsonSchemaException('data must be one of [1, 2, \'a\']')
@@ -16,6 +16,44 @@ def test_enum(asserter, value, expected):
     asserter({'enum': [1, 2, 'a']}, value, expected)
 
 
+exc = JsonSchemaException('data must be one of [1, False, None, [1], {\'a\': True}]')
+@pytest.mark.parametrize('value, expected', [
+    (1, 1),
+    (1.0, 1.0),
+    (True, exc),
+    (False, False),
+    (0, exc),
+    (None, None),
+    ([1], [1]),
+    ([2], exc),
+    ({'a': True}, {'a': True}),
+    ({'a': False}, exc),
+    ({'a': 1}, exc),
+    ([True], exc),
+    ([1.0], [1.0]),
+    ('1', exc),
+])
+def test_enum_types(asserter, value, expected):
+    asserter({'enum': [1, False, None, [1], {'a': True}]}, value, expected)
+
+
+@pytest.mark.parametrize('definition, value, expected', [
+    ({'const': 'a'}, 'a', 'a'),
+    ({'const': 'a'}, 'b', JsonSchemaException('data const not valid')),
+    ({'const': 1}, 1.0, 1.0),
+    ({'const': 1}, True, JsonSchemaException('data const not valid')),
+    ({'const': True}, 1, JsonSchemaException('data const not valid')),
+    ({'const': None}, None, None),
+    ({'const': {'a': [1]}}, {'a': [1]}, {'a': [1]}),
+    ({'const': {'a': [1]}}, {'a': [2]}, JsonSchemaException('data const not valid')),
+    ({'const': {'a': [1]}}, {'a': [True]}, JsonSchemaException('data const not valid')),
+    ({'const': [False]}, [0], JsonSchemaException('data const not valid')),
+    ({'const': [{'a': 1}]}, [{'a': 1.0}], [{'a': 1.0}]),
+])
+def test_const(asserter, definition, value, expected):
+    asserter(definition, value, expected, meta_schema='draft7')
+
+
 exc = JsonSchemaException('data must be string or number')
 @pytest.mark.parametrize('value, expected', [
     (0, 0),
@@ -89,6 +127,57 @@ def test_one_of_factorized(asserter, value, expected):
     }, value, expected)
 
 
+exc = JsonSchemaException('data must be valid exactly by one of oneOf definition')
+@pytest.mark.parametrize('value, expected', [
+    ({'kind': 'a', 'value': 1}, {'kind': 'a', 'value': 1}),
+    ({'kind': 'b', 'value': 'x'}, {'kind': 'b', 'value': 'x'}),
+    ({'kind': 'a', 'value': 'x'}, exc),
+    ({'kind': 'c'}, exc),
+    ({'kind': 1}, exc),
+    ({'kind': ['a']}, exc),
+    ({}, exc),
+    ([], exc),
+    ('a', exc),
+])
+def test_one_of_discriminator(asserter, value, expected):
+    asserter({'oneOf': [
+        {'properties': {'kind': {'enum': ['a']}, 'value': {'type': 'integer'}}, 'required': ['kind']},
+        {'properties': {'kind': {'enum': ['b']}, 'value': {'type': 'string'}}, 'required': ['kind', 'value']},
+    ]}, value, expected)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('a', JsonSchemaException('data must be valid exactly by one of oneOf definition')),
+    ({'kind': 'a'}, {'kind': 'a'}),
+    ({'kind': 'c'}, {'kind': 'c'}),
+    ({'kind': 'd'}, JsonSchemaException('data must be valid exactly by one of oneOf definition')),
+])
+def test_one_of_discriminator_const(asserter, value, expected):
+    asserter({'oneOf': [
+        {'properties': {'kind': {'const': 'a'}}, 'required': ['kind']},
+        {'properties': {'kind': {'const': 'b'}}, 'required': ['kind'], 'type': 'object'},
+        {'properties': {'kind': {'const': 'c'}}, 'required': ['kind']},
+    ]}, value, expected, meta_schema='draft7')
+
+
+@pytest.mark.benchmark(
+    min_time=0.01,
+    max_time=2,
+    min_rounds=20,
+    warmup=False
+)
+def test_bench_one_of_discriminator(benchmark):
+    validate = compile({'oneOf': [
+        {
+            'type': 'object',
+            'properties': {'kind': {'const': 'event{}'.format(index)}, 'value': {'type': 'integer'}},
+            'required': ['kind', 'value'],
+        }
+        for index in range(40)
+    ]})
+    benchmark(validate, {'kind': 'event39', 'value': 1})
+
+
 @pytest.mark.parametrize('value, expected', [
     (0, JsonSchemaException('data must not be valid by not definition')),
     (True, True),
@@ -98,3 +187,128 @@ def test_one_of_factorized(asserter, value, expected):
 ])
 def test_not(asserter, value, expected):
     asserter({'not': {'type': 'number'}}, value, expected)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({'kind': 'a', 'a': 1}, {'kind': 'a', 'a': 1}),
+    ({'kind': 'a'}, JsonSchemaException('data must contain [\'a\'] properties')),
+    ({'b': 1}, {'b': 1}),
+    ({}, JsonSchemaException('data must contain [\'b\'] properties')),
+    ('x', 'x'),
+])
+def test_if_then_else(asserter, value, expected):
+    asserter({
+        'if': {'properties': {'kind': {'const': 'a'}}, 'required': ['kind']},
+        'then': {'required': ['a']},
+        'else': {'required': ['b']},
+    }, value, expected, meta_schema='draft7')
+
+
+@pytest.mark.benchmark(
+    min_time=0.01,
+    max_time=2,
+    min_rounds=20,
+    warmup=False
+)
+@pytest.mark.parametrize('value', [
+    {'kind': 'a', 'a': 1},
+    {'kind': 'b', 'b': 1},
+], ids=['then', 'else'])
+def test_bench_if_then_else(benchmark, value):
+    validate = compile({
+        'if': {'properties': {'kind': {'const': 'a'}}, 'required': ['kind']},
+        'then': {'required': ['a']},
+        'else': {'required': ['b']},
+    })
+    benchmark(validate, value)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('ab', 'ab'),
+    ('a', JsonSchemaException('data must be longer than or equal to 2 characters')),
+    (5, 5),
+    (4.5, JsonSchemaException('data must be bigger than or equal to 5')),
+    ([1], [1]),
+    ([], JsonSchemaException('data must contain at least 1 items')),
+    ({'a': 1}, {'a': 1}),
+    ({}, JsonSchemaException('data must contain [\'a\'] properties')),
+    (None, None),
+])
+def test_keywords_of_more_types(asserter, value, expected):
+    asserter({
+        'minLength': 2,
+        'minimum': 5,
+        'minItems': 1,
+        'uniqueItems': False,
+        'required': ['a'],
+    }, value, expected)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({'a': 'a'}, {'a': 'a'}),
+    ({'a': 'a', 'b': 1}, JsonSchemaException('data.b must be string')),
+    ({'a': 'a', 'b': 'b', 'c': 'c'}, JsonSchemaException('data must contain less than or equal to 2 properties')),
+    ('a', JsonSchemaException('data must be object')),
+])
+def test_keywords_of_known_type(asserter, value, expected):
+    asserter({
+        'type': 'object',
+        'maxProperties': 2,
+        'minLength': 5,
+        'dependencies': {'a': {'minLength': 5, 'additionalProperties': {'type': 'string'}}},
+    }, value, expected)
+
+
+@pytest.mark.parametrize('order_by_cost, expected', [
+    (False, JsonSchemaException('data must match pattern ^a+$')),
+    (True, JsonSchemaException('data const not valid')),
+])
+def test_order_by_cost(asserter, order_by_cost, expected):
+    definition = {'type': 'string', 'pattern': '^a+$', 'const': 'aaa'}
+    asserter(definition, 'aaa', 'aaa', meta_schema='draft7', order_by_cost=order_by_cost)
+    asserter(definition, 'bbbb', expected, meta_schema='draft7', order_by_cost=order_by_cost)
+
+
+@pytest.mark.parametrize('frequencies, expected', [
+    ({}, 'data must be bigger than or equal to 10'),
+    ({'minimum': 1, 'multipleOf': 10}, 'data must be multiple of 3'),
+])
+def test_order_by_failure_frequencies(asserter, frequencies, expected):
+    asserter(
+        {'minimum': 10, 'multipleOf': 3},
+        4,
+        JsonSchemaException(expected),
+        order_by_cost=True,
+        failure_frequencies=frequencies,
+    )
+
+
+@pytest.mark.parametrize('definition, expected', [
+    (
+        {'properties': {'a': {'default': 1}}, 'minProperties': 1},
+        JsonSchemaException('data must contain at least 1 properties'),
+    ),
+    ({'allOf': [{'properties': {'a': {'default': 1}}}], 'minProperties': 1}, {'a': 1}),
+    ({'anyOf': [{'properties': {'a': {'default': 1}}}], 'minProperties': 1}, {'a': 1}),
+    ({'allOf': [{'$ref': '#/definitions/a'}], 'minProperties': 1, 'definitions': {
+        'a': {'properties': {'a': {'default': 1}}},
+    }}, {'a': 1}),
+])
+def test_order_by_cost_keeps_defaults(asserter, definition, expected):
+    asserter(definition, {}, expected)
+    asserter(definition, {}, expected, order_by_cost=True)
+
+
+def test_order_by_cost_keeps_nested_defaults(asserter):
+    asserter({
+        'items': {'allOf': [{'properties': {'a': {'default': 1}}}]},
+        'contains': {'required': ['a']},
+    }, [{}], [{'a': 1}], meta_schema='draft7', order_by_cost=True)
+
+
+def test_order_by_cost_recursive_ref(asserter):
+    asserter({
+        'definitions': {'node': {'type': 'object', 'additionalProperties': {'$ref': '#/definitions/node'}}},
+        'allOf': [{'$ref': '#/definitions/node'}],
+        'maxProperties': 1,
+    }, {'a': {'b': {}}}, {'a': {'b': {}}}, order_by_cost=True)
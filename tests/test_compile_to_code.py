@@ -3,7 +3,6 @@ import pytest
 from fastjsonschema import JsonSchemaException, compile_to_code
 from fastjsonschema.generator import CodeGenerator
 from fastjsonschema.ref_resolver import RefResolver
-from fastjsonschema.formats import FormatManager
 from fastjsonschema.config import Config
 
 
@@ -43,6 +42,84 @@ def test_compile_to_code_with_regex(asserter_cc, value, expected, filename):
     )
 
 
+@pytest.mark.parametrize('value, expected', [
+    ({'a': 'a', 'b': 3}, True),
+    ({'a': 'a', 'b': 15}, False),
+    ({'a': None, 'b': 5}, False),
+    ({'a': 'a', 'b': 5, 'c': [1, 'x']}, True),
+    ({'a': 'a', 'b': 5, 'c': [1, 2]}, False),
+])
+def test_compile_to_code_boolean_mode(value, expected):
+    name, code = compile_to_code({
+        'properties': {
+            'a': {'anyOf': [{'type': 'string'}, {'type': 'number'}]},
+            'b': {'oneOf': [{'multipleOf': 3}, {'multipleOf': 5}]},
+            'c': {'not': {'items': {'type': 'number'}}, 'contains': {'type': 'string'}},
+        },
+        'if': {'required': ['c']},
+        'then': {'required': ['a']},
+    }, Config(meta_schema='draft7', mode='boolean'))
+    assert 'raise' not in code
+    assert 'try:' not in code
+    compile_state = {}
+    exec(code, compile_state)
+    assert compile_state[name](value) is expected
+
+
+@pytest.mark.parametrize('options', [
+    {'mode': 'bool'},
+    {'mode': 'Errors'},
+    {'max_errors': 3},
+    {'mode': 'boolean', 'max_errors': 3},
+])
+def test_config_invalid_mode(options):
+    with pytest.raises(ValueError):
+        Config(**options)
+
+
+def test_config_mode_none():
+    assert Config(mode=None).mode == 'exception'
+
+
+REF_DEFINITION = {
+    'definitions': {
+        'name': {'type': 'string', 'maxLength': 64},
+        'node': {
+            'type': 'object',
+            'properties': {'name': {'$ref': '#/definitions/name'}, 'children': {
+                'type': 'array', 'items': {'$ref': '#/definitions/node'},
+            }},
+        },
+    },
+    'properties': {
+        'first': {'$ref': '#/definitions/name'},
+        'last': {'$ref': '#/definitions/name'},
+        'tree': {'$ref': '#/definitions/node'},
+    },
+}
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({'first': 'a', 'tree': {'name': 'b', 'children': [{'name': 'c'}]}}, True),
+    ({'first': 1}, False),
+    ({'last': 'a' * 65}, False),
+    ({'tree': {'children': [{'name': 1}]}}, False),
+])
+def test_compile_to_code_inlined_refs(value, expected):
+    name, code = compile_to_code(REF_DEFINITION, Config(mode='boolean'))
+    assert 'def validate__definitions_name(' not in code
+    # recursive definition stays function
+    assert 'def validate__definitions_node(' in code
+    compile_state = {}
+    exec(code, compile_state)
+    assert compile_state[name](value) is expected
+
+
+def test_compile_to_code_not_inlined_refs():
+    _, code = compile_to_code(REF_DEFINITION, Config(ref_inline_limit=0))
+    assert 'def validate__definitions_name(' in code
+
+
 @pytest.mark.benchmark(
     min_time=0.01,
     max_time=2,
@@ -82,5 +159,4 @@ def test_bench_code_gen(benchmark):
         },
         config=Config()
     )
-    format_manager = FormatManager()
-    benchmark(CodeGenerator, resolver=current_resolver, formats=format_manager, config=CONFIG)
+    benchmark(CodeGenerator, resolver=current_resolver, config=CONFIG)
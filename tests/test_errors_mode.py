@@ -0,0 +1,70 @@
+import pytest
+
+from fastjsonschema import Config, JsonSchemaValueException, compile, compile_to_code
+
+
+DEFINITION = {
+    'type': 'object',
+    'properties': {
+        'name': {'type': 'string', 'maxLength': 3},
+        'tags': {'type': 'array', 'items': {'type': 'integer'}},
+        'a/b': {'$ref': '#/definitions/positive'},
+    },
+    'additionalProperties': {'type': 'boolean'},
+    'definitions': {
+        'positive': {'minimum': 0},
+    },
+}
+
+
+def test_errors_mode_valid():
+    validate = compile(DEFINITION, Config(mode='errors'))
+    assert validate({'name': 'abc', 'tags': [1, 2], 'a/b': 1, 'x': True}) == []
+
+
+def test_errors_mode_collects_all_errors():
+    validate = compile(DEFINITION, Config(mode='errors'))
+    errors = validate({'name': 'abcd', 'tags': [1, 'x', 3, 'y'], 'a/b': -1, 'x': 1})
+    assert all(isinstance(error, JsonSchemaValueException) for error in errors)
+    assert [(error.pointer, error.schema_path, error.keyword, error.value) for error in errors] == [
+        ('/name', '#/properties/name/maxLength', 'maxLength', 'abcd'),
+        ('/tags/1', '#/properties/tags/items/type', 'type', 'x'),
+        ('/tags/3', '#/properties/tags/items/type', 'type', 'y'),
+        ('/a~1b', '#/definitions/positive/minimum', 'minimum', -1),
+        ('/x', '#/additionalProperties/type', 'type', 1),
+    ]
+    assert errors[0].message == 'data.name must be shorter than or equal to 3 characters'
+    assert errors[1].path == ('tags', 1)
+
+
+def test_errors_mode_continues_after_type_error():
+    validate = compile({'type': 'string', 'minLength': 2, 'minItems': 2}, Config(mode='errors'))
+    errors = validate([1])
+    assert [error.keyword for error in errors] == ['type', 'minItems']
+
+
+@pytest.mark.parametrize('max_errors, expected', [
+    (None, 5),
+    (1, 1),
+    (3, 3),
+    (10, 5),
+])
+def test_errors_mode_max_errors(max_errors, expected):
+    validate = compile({'items': {'type': 'string'}}, Config(mode='errors', max_errors=max_errors))
+    assert len(validate([1, 2, 3, 4, 5])) == expected
+    assert validate(['a']) == []
+
+
+def test_errors_mode_composite_keywords():
+    validate = compile({
+        'anyOf': [{'type': 'string'}, {'type': 'null'}],
+        'not': {'enum': ['x']},
+    }, Config(mode='errors'))
+    assert [(error.schema_path, error.keyword) for error in validate(1)] == [('#/anyOf', 'anyOf')]
+    assert [(error.schema_path, error.keyword) for error in validate('x')] == [('#/not', 'not')]
+
+
+def test_exception_mode_code_unchanged_by_errors_mode():
+    _, code = compile_to_code(DEFINITION)
+    assert 'errors' not in code
+    assert 'JsonSchemaValueException' not in code
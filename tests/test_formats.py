@@ -0,0 +1,275 @@
+import pytest
+
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor
+
+import jsonpointer
+import rfc3987
+
+from fastjsonschema import Config, JsonSchemaException, compile, compile_to_code, formats
+from fastjsonschema.formats import (
+    FORMAT_FUNCTIONS,
+    FormatManager,
+    is_valid_date,
+    is_valid_date_time,
+    is_valid_ipv4,
+    is_valid_ipv6,
+    is_valid_iri,
+    is_valid_json_pointer,
+    is_valid_time,
+)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2018-02-05', True),
+    ('2016-02-29', True),
+    ('2000-02-29', True),
+    ('2018-12-31', True),
+    ('1900-02-29', False),
+    ('2018-02-29', False),
+    ('2018-04-31', False),
+    ('2018-13-01', False),
+    ('2018-00-01', False),
+    ('2018-01-00', False),
+    ('2018-1-05', False),
+    ('2018/02/05', False),
+    ('2018-02-05 ', False),
+    ('2018-02-0a', False),
+    ('2018-02-0٣', False),
+    ('2013-350', False),
+    ('', False),
+])
+def test_date(value, expected):
+    assert is_valid_date(value) is expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('08:30:06Z', True),
+    ('08:30:06z', True),
+    ('08:30:06.283185Z', True),
+    ('23:59:60Z', True),
+    ('00:59:60+01:00', True),
+    ('15:59:60-08:00', True),
+    ('23:29:60-00:30', True),
+    ('23:29:60+00:30', False),
+    ('12:00:60Z', False),
+    ('23:59:60+01:00', False),
+    ('23:58:60Z', False),
+    ('08:30:06.2-08:00', True),
+    ('08:30:06', False),
+    ('08:30Z', False),
+    ('24:00:00Z', False),
+    ('08:60:00Z', False),
+    ('08:30:61Z', False),
+    ('08:30:06.Z', False),
+    ('08:30:06,1Z', False),
+    ('08:30:06+24:00', False),
+    ('08:30:06+01:60', False),
+    ('08:30:06+0100', False),
+    ('08:30:06 PST', False),
+    ('01:01:01,1111', False),
+])
+def test_time(value, expected):
+    assert is_valid_time(value) is expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('1963-06-19T08:30:06.283185Z', True),
+    ('1963-06-19T08:30:06Z', True),
+    ('1937-01-01T12:00:27.87+00:20', True),
+    ('1990-12-31T15:59:50.123-08:00', True),
+    ('1963-06-19t08:30:06.283185z', True),
+    ('1990-02-31T15:59:59.123-08:00', False),
+    ('1998-12-31T23:59:60Z', True),
+    ('1998-12-31T15:59:60.123-08:00', True),
+    ('2018-02-05T12:00:60Z', False),
+    ('1990-12-31T15:59:60-24:00', False),
+    ('06/19/1963 08:30:06 PST', False),
+    ('2013-350T01:01:01', False),
+    ('1963-06-19 08:30:06Z', False),
+    ('1963-06-19T08:30:06', False),
+])
+def test_date_time(value, expected):
+    assert is_valid_date_time(value) is expected
+
+
+# realistic valid value of each format of ``FORMAT_FUNCTIONS``
+FORMAT_FUNCTIONS_VALUES = {
+    'date': '2018-02-05',
+    'date-time': '2018-02-05T14:17:10.123Z',
+    'idn-email': 'jöhn.doe@exämple.com',
+    'idn-hostname': 'api.exämple.com',
+    'ipv4': '192.168.100.254',
+    'ipv6': '2001:db8:85a3::8a2e:370:7334',
+    'iri': 'https://exämple.com/päth?query=1#frägment',
+    'iri-reference': '/päth?query=1',
+    'json-pointer': '/definitions/a~1b/0',
+    'regex': '^[a-z]+-[0-9]{2,4}$',
+    'time': '14:17:10.123+01:00',
+    'uri-reference': '../path?query=1#fragment',
+}
+
+
+def test_format_functions_values():
+    assert sorted(FORMAT_FUNCTIONS_VALUES) == sorted(FORMAT_FUNCTIONS)
+    for name, value in FORMAT_FUNCTIONS_VALUES.items():
+        assert FORMAT_FUNCTIONS[name](value), name
+
+
+def test_optional_dependencies_bound_on_first_use():
+    assert not is_valid_iri('not iri')
+    assert formats._parse_rfc3987 is rfc3987.parse
+    assert not is_valid_json_pointer('not pointer')
+    assert formats._JsonPointerException is jsonpointer.JsonPointerException
+
+
+@pytest.mark.benchmark(
+    min_time=0.01,
+    max_time=2,
+    min_rounds=20,
+    warmup=False
+)
+@pytest.mark.parametrize('name', sorted(FORMAT_FUNCTIONS_VALUES))
+def test_bench_format_functions(benchmark, name):
+    benchmark(FORMAT_FUNCTIONS[name], FORMAT_FUNCTIONS_VALUES[name])
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('192.168.0.1', True),
+    ('0.0.0.0', True),
+    ('255.255.255.255', True),
+    ('10.0.100.249', True),
+    ('256.0.0.1', False),
+    ('192.168.0', False),
+    ('192.168.0.1.1', False),
+    ('192.168.00.1', False),
+    ('087.10.0.1', False),
+    ('192.168.0.1\n', False),
+    ('192.168.0.١', False),
+    ('0x7f000001', False),
+    ('', False),
+])
+def test_ipv4(value, expected):
+    assert is_valid_ipv4(value) is expected
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('::', True),
+    ('::1', True),
+    ('fe80::1', True),
+    ('1::', True),
+    ('2001:db8:85a3::8a2e:370:7334', True),
+    ('2001:0DB8:85A3:0000:0000:8A2E:0370:7334', True),
+    ('1:2:3:4:5:6:7::', True),
+    ('::ffff:192.168.0.1', True),
+    ('1:2:3:4:5:6:1.2.3.4', True),
+    ('12345::', False),
+    ('1:2:3:4:5:6:7', False),
+    ('1:2:3:4:5:6:7:8:9', False),
+    ('1:2:3:4:5:6:7:8::', False),
+    ('1::2::3', False),
+    (':1::2', False),
+    ('1:::2', False),
+    ('::laptop', False),
+    ('::ffff:192.168.0.256', False),
+    ('1:2:3:4:5:6:7:1.2.3.4', False),
+    ('1.2.3.4', False),
+    ('fe80::1%eth0', False),
+    ('::١', False),
+    (':', False),
+])
+def test_ipv6(value, expected):
+    assert is_valid_ipv6(value) is expected
+
+
+def _is_valid_ipaddress(value):
+    try:
+        ipaddress.ip_address(value)
+    except ValueError:
+        return False
+    return True
+
+
+IP_ADDRESSES = [
+    '10.0.12.7',
+    '192.168.100.254',
+    '2001:db8:85a3::8a2e:370:7334',
+    'fe80::1ff:fe23:4567:890a',
+    '::ffff:10.0.12.7',
+]
+
+
+@pytest.mark.benchmark(
+    min_time=0.01,
+    max_time=2,
+    min_rounds=20,
+    warmup=False
+)
+@pytest.mark.parametrize('function', [
+    lambda value: is_valid_ipv4(value) or is_valid_ipv6(value),
+    _is_valid_ipaddress,
+], ids=['formats', 'ipaddress'])
+def test_bench_ip_address(benchmark, function):
+    @benchmark
+    def f():
+        for address in IP_ADDRESSES:
+            assert function(address)
+
+
+def test_cached_function():
+    format_manager = FormatManager()
+    is_valid_email = format_manager.get_cached_function('email', 2)
+    assert format_manager.get_cached_function('email', 2) is is_valid_email
+    assert is_valid_email('john@example.com') is True
+    assert is_valid_email('john@example.com') is True
+    assert is_valid_email('john') is False
+    assert is_valid_email('jane@example.com') is True
+    info = format_manager.cache_info()['email']
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 3, 2, 2)
+    format_manager.cache_clear()
+    assert format_manager.cache_info()['email'].currsize == 0
+
+
+def test_cached_function_info_of_more_sizes():
+    format_manager = FormatManager()
+    format_manager.get_cached_function('date', 2)('2018-02-05')
+    format_manager.get_cached_function('date', 8)('2018-02-30')
+    info = format_manager.cache_info()['date']
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (0, 2, 10, 2)
+
+
+def test_cached_function_threads():
+    format_manager = FormatManager()
+    values = ['192.168.0.{}'.format(index % 300) for index in range(3000)]
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda value: format_manager.get_cached_function('ipv4', 64)(value), values))
+    assert results == [is_valid_ipv4(value) for value in values]
+
+
+FORMAT_CACHE_DEFINITION = {'properties': {
+    'a': {'format': 'ipv4'},
+    'b': {'format': 'hostname'},
+}}
+
+
+def test_format_cache_size_code():
+    _, code = compile_to_code(FORMAT_CACHE_DEFINITION, Config(format_cache_size=100))
+    assert "format_manager.get_cached_function('ipv4', 100)" in code
+    assert "format_manager.get_cached_function('hostname', 100)" in code
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({'a': '10.0.0.1', 'b': 'example.com'}, None),
+    ({'a': '10.0.0.256'}, 'data.a must be a valid ipv4'),
+    ({'b': '-example'}, 'data.b must be hostname'),
+])
+def test_format_cache_size(value, expected):
+    validate = compile(FORMAT_CACHE_DEFINITION, Config(format_cache_size=100, cache_validators=False))
+    validate_boolean = compile(FORMAT_CACHE_DEFINITION, Config(format_cache_size=100, mode='boolean'))
+    assert validate_boolean(value) is (expected is None)
+    if expected is None:
+        assert validate(value) == value
+    else:
+        with pytest.raises(JsonSchemaException) as excinfo:
+            validate(value)
+        assert excinfo.value.message == expected
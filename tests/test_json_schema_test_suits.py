@@ -1,4 +1,5 @@
 import json
+from copy import deepcopy
 from pathlib import Path
 
 import pytest
@@ -7,7 +8,6 @@ import requests
 from fastjsonschema import JsonSchemaException, compile
 from fastjsonschema.generator import CodeGenerator
 from fastjsonschema.ref_resolver import RefResolver
-from fastjsonschema.formats import FormatManager
 from fastjsonschema.config import Config
 
 
@@ -52,10 +52,51 @@ def template_test(schema, meta_schema, data, is_valid):
     )
     # For debug purposes. When test fails, it will print stdout.
     resolver = RefResolver.from_schema(schema, config=config)
-    format_manager = FormatManager()
-    code_generator = CodeGenerator(resolver=resolver, formats=format_manager, config=config)
+    code_generator = CodeGenerator(resolver=resolver, config=config)
     print(code_generator.code)
 
+    validate_boolean = compile(schema, Config(
+        meta_schema=meta_schema,
+        uri_handlers={'http': remotes_handler},
+        validate_schema=False,
+        mode='boolean',
+    ))
+    assert validate_boolean(deepcopy(data)) is is_valid
+
+    validate_errors = compile(schema, Config(
+        meta_schema=meta_schema,
+        uri_handlers={'http': remotes_handler},
+        validate_schema=False,
+        mode='errors',
+    ))
+    assert (validate_errors(deepcopy(data)) == []) is is_valid
+
+    validate_batch = compile(schema, Config(
+        meta_schema=meta_schema,
+        uri_handlers={'http': remotes_handler},
+        validate_schema=False,
+        batch=True,
+    ))
+    assert (validate_batch([deepcopy(data)]) == []) is is_valid
+
+    validate_ordered = compile(schema, Config(
+        meta_schema=meta_schema,
+        uri_handlers={'http': remotes_handler},
+        validate_schema=False,
+        mode='boolean',
+        order_by_cost=True,
+    ))
+    assert validate_ordered(deepcopy(data)) is is_valid
+
+    validate_format_cache = compile(schema, Config(
+        meta_schema=meta_schema,
+        uri_handlers={'http': remotes_handler},
+        validate_schema=False,
+        mode='boolean',
+        format_cache_size=16,
+    ))
+    assert validate_format_cache(deepcopy(data)) is is_valid
+
     validate = compile(schema, config)
     try:
         result = validate(data)
@@ -1,7 +1,9 @@
 
+import tracemalloc
+
 import pytest
 
-from fastjsonschema import JsonSchemaException
+from fastjsonschema import JsonSchemaException, compile
 
 
 exc = JsonSchemaException('data must be object')
@@ -43,10 +45,10 @@ def test_min_properties(asserter, value, expected):
     }, value, expected)
 
 
-exc = JsonSchemaException('data must contain [\'a\', \'b\'] properties')
 @pytest.mark.parametrize('value, expected', [
-    ({}, exc),
-    ({'a': 1}, exc),
+    ({}, JsonSchemaException('data must contain [\'a\', \'b\'] properties')),
+    ({'a': 1}, JsonSchemaException('data must contain [\'b\'] properties')),
+    ({'b': 1}, JsonSchemaException('data must contain [\'a\'] properties')),
     ({'a': 1, 'b': 2}, {'a': 1, 'b': 2}),
 ])
 def test_required(asserter, value, expected):
@@ -56,6 +58,19 @@ def test_required(asserter, value, expected):
     }, value, expected)
 
 
+REQUIRED = ['a', 'b', 'c', 'd', 'e', 'f']
+@pytest.mark.parametrize('value, expected', [
+    ({}, JsonSchemaException('data must contain {} properties'.format(REQUIRED))),
+    ({'a': 1, 'c': 2, 'f': 3}, JsonSchemaException('data must contain [\'b\', \'d\', \'e\'] properties')),
+    (dict.fromkeys(REQUIRED, 1), dict.fromkeys(REQUIRED, 1)),
+])
+def test_required_many(asserter, value, expected):
+    asserter({
+        'type': 'object',
+        'required': REQUIRED,
+    }, value, expected)
+
+
 @pytest.mark.parametrize('value, expected', [
     ({}, {}),
     ({'a': 1}, {'a': 1}),
@@ -92,6 +107,40 @@ def test_properties_with_additional_properties(asserter, value, expected):
     }, value, expected)
 
 
+@pytest.mark.parametrize('value, expected', [
+    ({'a': 1, 'b': '', 'additional': ''}, {'a': 1, 'b': '', 'additional': ''}),
+    ({'a': 1, 'b': 2}, JsonSchemaException('data.b must be string')),
+    ({'a': 1, 'b': '', 'ab': True}, JsonSchemaException('data.ab must be string')),
+    ({'a': 1, 'b': '', 'xb': True}, JsonSchemaException('data.xb must be string')),
+    ({'a': 1, 'b': '', 'x': True}, {'a': 1, 'b': '', 'x': True}),
+    ({'a': 1, 'b': '', 'x': ''}, JsonSchemaException('data.x must be boolean')),
+])
+def test_properties_with_pattern_and_additional_properties(asserter, value, expected):
+    asserter({
+        'type': 'object',
+        'properties': {
+            'a': {'type': 'number'},
+            'b': {'type': 'string'},
+        },
+        'patternProperties': {
+            '^x$': {'type': 'boolean'},
+        },
+        'additionalProperties': {'type': 'string'},
+    }, value, expected)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({}, {}),
+    ({'a': 1, 'b': True}, {'a': 1, 'b': True}),
+])
+def test_additional_properties_empty_schema(asserter, value, expected):
+    asserter({
+        'type': 'object',
+        'properties': {'a': {'type': 'number'}},
+        'additionalProperties': {},
+    }, value, expected)
+
+
 @pytest.mark.parametrize('value, expected', [
     ({}, {}),
     ({'a': 1}, {'a': 1}),
@@ -130,6 +179,55 @@ def test_pattern_properties(asserter, value, expected):
         'additionalProperties': False,
     }, value, expected)
 
+@pytest.mark.parametrize('value, expected', [
+    ({}, {}),
+    ({'x-a': 'a', 'id': 1, 'created_at': 'a', 'zz': 1}, {'x-a': 'a', 'id': 1, 'created_at': 'a', 'zz': 1}),
+    ({'x-a': 1}, JsonSchemaException('data.x-a must be string')),
+    ({'ax-a': 1}, JsonSchemaException('data must contain only specified properties')),
+    ({'id': 'a'}, JsonSchemaException('data.id must be integer')),
+    ({'idx': 'a'}, JsonSchemaException('data must contain only specified properties')),
+    ({'created_at': 1}, JsonSchemaException('data.created_at must be string')),
+    ({'a.b': 1}, JsonSchemaException('data.a.b must be string')),
+    ({'axb': 1}, JsonSchemaException('data must contain only specified properties')),
+    ({'n1': 'a'}, {'n1': 'a'}),
+    ({'n1': 1}, JsonSchemaException('data.n1 must be string')),
+    ({'abc': 1.5}, JsonSchemaException('data.abc must be integer')),
+    ({'abab': 'a'}, JsonSchemaException('data.abab must be integer')),
+    ({'abab1': 1}, JsonSchemaException('data.abab1 must be string')),
+])
+def test_pattern_properties_kinds(asserter, value, expected):
+    asserter({
+        'type': 'object',
+        'patternProperties': {
+            '^x-': {'type': 'string'},
+            '^id$': {'type': 'integer'},
+            '_at$': {'type': 'string'},
+            'a\\.b': {'type': 'string'},
+            '\\d$': {'type': 'string'},
+            '(ab)+': {'type': 'integer'},
+            '(ab)\\1': {'minimum': 2},
+            'zz': True,
+        },
+        'additionalProperties': False,
+    }, value, expected)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({'a-b': 'x', 'a_b': 1, 'ab': None}, {'a-b': 'x', 'a_b': 1, 'ab': None}),
+    ({'a-b': 1}, JsonSchemaException('data.a-b must be string')),
+    ({'a_b': 'x'}, JsonSchemaException('data.a_b must be integer')),
+    ({'a-b': 'x', 'ab': 1}, JsonSchemaException('data.ab must be null')),
+])
+def test_pattern_properties_exact_keys(asserter, value, expected):
+    asserter({
+        'patternProperties': {
+            '^a-b$': {'type': 'string'},
+            '^a_b$': {'type': 'integer'},
+            '^ab$': {'type': 'null'},
+        },
+    }, value, expected)
+
+
 @pytest.mark.parametrize('value, expected', [
     ({'id': 1}, {'id': 1}),
     ({'id': 'a'}, JsonSchemaException('data.id must be integer')),
@@ -155,3 +253,53 @@ def test_object_with_ref_property(asserter, value, expected):
             "$ref": {"type": "string"}
         }
     }, value, expected)
+
+
+NESTED_DEFINITION = {
+    'type': 'array',
+    'items': {
+        'type': 'object',
+        'properties': {
+            'a': {'type': 'integer'},
+            'b': {
+                'type': 'object',
+                'properties': {'c': {'type': 'string'}},
+                'dependencies': {'c': ['d']},
+            },
+        },
+        'patternProperties': {'^x': {'type': 'string'}},
+    },
+}
+
+
+def _nested_data(number_of_keys):
+    extra = {str(index): index for index in range(number_of_keys)}
+    return [dict(extra, a=index, b=dict(extra, c='c', d=1), x='y') for index in range(100)]
+
+
+def _allocated_peak(validate, data):
+    validate(data)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        validate(data)
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def test_properties_do_not_copy_keys():
+    validate = compile(NESTED_DEFINITION)
+    # copy of keys would need memory depending on size of objects
+    assert _allocated_peak(validate, _nested_data(200)) - _allocated_peak(validate, _nested_data(10)) < 1000
+
+
+@pytest.mark.benchmark(
+    min_time=0.01,
+    max_time=2,
+    min_rounds=20,
+    warmup=False
+)
+def test_bench_nested_objects(benchmark):
+    validate = compile(NESTED_DEFINITION)
+    benchmark(validate, _nested_data(20))
@@ -0,0 +1,40 @@
+import pickle
+
+import pytest
+
+from fastjsonschema import Config, JsonSchemaException, JsonSchemaValueException
+from fastjsonschema.parallel import ParallelValidator
+
+
+DEFINITION = {'type': 'object', 'properties': {'a': {'type': 'integer'}}}
+DOCUMENTS = [{'a': index} if index % 7 else {'a': str(index)} for index in range(100)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 9, 1000])
+def test_parallel_validator_keeps_order(chunk_size):
+    with ParallelValidator(DEFINITION, workers=2, chunk_size=chunk_size) as validator:
+        failures = validator.validate(iter(DOCUMENTS))
+    assert [index for index, _ in failures] == list(range(0, 100, 7))
+    assert all(isinstance(error, JsonSchemaException) for _, error in failures)
+    assert failures[1][1].message == 'data.a must be integer'
+
+
+def test_parallel_validator_generator():
+    documents = ({'a': index} if index % 1000 else {'a': None} for index in range(10000))
+    with ParallelValidator(DEFINITION, Config(mode='boolean'), workers=2, chunk_size=10) as validator:
+        assert validator.validate(documents) == list(range(0, 10000, 1000))
+
+
+def test_parallel_validator_modes():
+    with ParallelValidator(DEFINITION, Config(mode='boolean'), workers=2, chunk_size=10) as validator:
+        assert validator.validate(DOCUMENTS) == list(range(0, 100, 7))
+    with ParallelValidator(DEFINITION, Config(mode='errors'), workers=2, chunk_size=10) as validator:
+        failures = validator.validate(DOCUMENTS)
+    assert [(index, errors[0].pointer) for index, errors in failures[:2]] == [(0, '/a'), (7, '/a')]
+
+
+def test_exceptions_are_picklable():
+    exception = pickle.loads(pickle.dumps(JsonSchemaException('message')))
+    assert exception.message == 'message'
+    exception = pickle.loads(pickle.dumps(JsonSchemaValueException('message', 1, ('a',), '#/type', 'type')))
+    assert (exception.message, exception.value, exception.pointer, exception.keyword) == ('message', 1, '/a', 'type')
@@ -0,0 +1,74 @@
+import pytest
+
+from fastjsonschema import Config, JsonSchemaException, compile, compile_to_code
+from fastjsonschema.profile import get_branch_profile, load_branch_profile, save_branch_profile
+
+
+DEFINITION = {
+    'properties': {
+        'a': {'anyOf': [{'type': 'string'}, {'type': 'null'}, {'type': 'integer'}]},
+    },
+    'oneOf': [{'required': ['a']}, {'required': ['b']}],
+}
+
+
+@pytest.mark.parametrize('mode', ['exception', 'boolean', 'errors'])
+def test_profile_branches(mode):
+    validate = compile(DEFINITION, Config(profile_branches=True, mode=mode, cache_validators=False))
+    for value in range(5):
+        validate({'a': value})
+    validate({'a': 'x'})
+    validate({'b': None})
+    assert get_branch_profile(validate) == {
+        '#/properties/a/anyOf': [1, 0, 5],
+        '#/oneOf': [6, 1],
+    }
+
+
+def test_profile_branches_invalid():
+    validate = compile(DEFINITION, Config(profile_branches=True, cache_validators=False))
+    with pytest.raises(JsonSchemaException):
+        validate({'a': 1.5})
+    assert get_branch_profile(validate)['#/properties/a/anyOf'] == [0, 0, 0]
+
+
+def test_profile_branches_not_shared():
+    config = Config(profile_branches=True)
+    validate = compile(DEFINITION, config)
+    other_validate = compile(DEFINITION, config)
+    assert validate is not other_validate
+    validate({'a': 1})
+    assert get_branch_profile(validate)['#/oneOf'] == [1, 0]
+    assert get_branch_profile(other_validate)['#/oneOf'] == [0, 0]
+
+
+def test_save_and_load_branch_profile(tmpdir):
+    validate = compile(DEFINITION, Config(profile_branches=True, cache_validators=False))
+    validate({'a': 1})
+    path = str(tmpdir.join('profile.json'))
+    save_branch_profile(validate, path)
+    assert load_branch_profile(path) == get_branch_profile(validate)
+
+
+def test_branch_profile_order():
+    _, code = compile_to_code(DEFINITION, Config(branch_profile={
+        '#/properties/a/anyOf': [1, 0, 5],
+        # number of definitions doesn't match, profile is ignored
+        '#/oneOf': [0, 0, 1],
+    }))
+    assert 'validate__any_of_2(data_a) or validate__any_of_0(data_a) or validate__any_of_1(data_a)' in code
+    assert code.index("['a']") < code.index("['b']")
+
+
+@pytest.mark.parametrize('value, expected', [
+    ({'a': None}, True),
+    ({'a': 1.5}, False),
+    ({'a': 'a', 'b': 1}, False),
+    ({}, False),
+])
+def test_branch_profile_validation(value, expected):
+    validate = compile(DEFINITION, Config(mode='boolean', branch_profile={
+        '#/properties/a/anyOf': [1, 0, 5],
+        '#/oneOf': [1, 6],
+    }))
+    assert validate(value) is expected
@@ -0,0 +1,83 @@
+import io
+import pathlib
+
+import pytest
+from click.testing import CliRunner
+
+from fastjsonschema import JsonSchemaException, compile, main
+from fastjsonschema.stream import validate_lines
+
+
+CONTENT = b'{"a": 1}\n{"a": "x"}\n\n{"a": 2}\r\nnot json\n{"a": 3}'
+
+
+@pytest.fixture
+def validator():
+    return compile({'type': 'object', 'properties': {'a': {'type': 'integer'}}})
+
+
+def _results(results):
+    return [(line_no, ok, error.message if error else None) for line_no, ok, error in results]
+
+
+EXPECTED = [
+    (1, True, None),
+    (2, False, 'data.a must be integer'),
+    (4, True, None),
+    (5, False, 'line 5 is not valid JSON: Expecting value: line 1 column 1 (char 0)'),
+    (6, True, None),
+]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 10, 1024])
+def test_validate_lines_file_object(validator, chunk_size):
+    assert _results(validate_lines(validator, io.BytesIO(CONTENT), chunk_size=chunk_size)) == EXPECTED
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_validate_lines_path(validator, tmpdir, use_mmap):
+    path = tmpdir.join('data.jsonl')
+    path.write_binary(CONTENT)
+    assert _results(validate_lines(validator, str(path), use_mmap=use_mmap)) == EXPECTED
+
+
+def test_validate_lines_path_object(validator, tmpdir):
+    path = tmpdir.join('data.jsonl')
+    path.write_binary(CONTENT)
+    assert _results(validate_lines(validator, pathlib.Path(str(path)))) == EXPECTED
+
+
+def test_validate_lines_invalid_utf8(validator):
+    results = _results(validate_lines(validator, io.BytesIO(b'{"a": 1}\n{"a": "\xff"}\n')))
+    assert results[0] == (1, True, None)
+    assert results[1][:2] == (2, False)
+    assert results[1][2].startswith('line 2 is not valid JSON')
+
+
+def test_validate_lines_long_line(validator):
+    content = b'{"a": 1, "b": "' + b'x' * 10000 + b'"}\n{"a": "x"}'
+    assert _results(validate_lines(validator, io.BytesIO(content), chunk_size=7)) == [
+        (1, True, None),
+        (2, False, 'data.a must be integer'),
+    ]
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_validate_lines_empty_file(validator, tmpdir, use_mmap):
+    path = tmpdir.join('data.jsonl')
+    path.write_binary(b'')
+    assert list(validate_lines(validator, str(path), use_mmap=use_mmap)) == []
+
+
+def test_validate_lines_is_lazy(validator):
+    results = validate_lines(validator, io.BytesIO(b'{}\n' * 10 + b'[]\n'))
+    assert next(results) == (1, True, None)
+    assert isinstance(list(results)[-1][2], JsonSchemaException)
+
+
+def test_cli_validate_json_lines(tmpdir):
+    path = tmpdir.join('data.jsonl')
+    path.write_binary(CONTENT)
+    result = CliRunner().invoke(main, ['{"properties": {"a": {"type": "integer"}}}', '-v', str(path)])
+    assert 'Line 2: data.a must be integer' in result.output
+    assert '2 of 5 documents are invalid' in result.output
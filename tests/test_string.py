@@ -1,7 +1,7 @@
 
 import pytest
 
-from fastjsonschema import JsonSchemaException
+from fastjsonschema import JsonSchemaException, compile_to_code
 
 
 exc = JsonSchemaException('data must be string')
@@ -71,3 +71,27 @@ def test_regex_pattern(asserter, value, expected):
         'format': 'regex',
         'type': 'string'
     }, value, expected)
+
+
+exc = JsonSchemaException('data must be hostname')
+@pytest.mark.parametrize('value, expected', [
+    ('example.com', 'example.com'),
+    ('example..com', exc),
+    ('-', exc),
+])
+def test_hostname_format(asserter, value, expected):
+    asserter({
+        'format': 'hostname',
+        'type': 'string'
+    }, value, expected)
+
+
+def test_formats_bound_on_module_level():
+    _, code = compile_to_code({'properties': {
+        'a': {'format': 'hostname'},
+        'b': {'format': 'hostname'},
+        'c': {'format': 'regex'},
+    }})
+    assert code.count("format_manager.get_function('hostname')") == 1
+    assert 'FormatManager()' not in code
+    assert 'if not is_valid_regexp(data_c):' in code